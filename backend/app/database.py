@@ -9,12 +9,19 @@ import uuid
 import logging
 from datetime import datetime, timezone
 from sqlalchemy import (
-    create_engine, Column, String, Integer, Float, Text,
+    create_engine, event, Column, String, Integer, Float, Text,
     DateTime, ForeignKey, JSON
 )
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
 from app.config import get_settings
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
@@ -37,13 +44,31 @@ db_url = _get_db_url()
 is_sqlite = db_url.startswith("sqlite")
 
 engine_kwargs = {"pool_pre_ping": True}
+if HAS_ORJSON:
+    # JSON columns (CompanyRecord.data holds the full report) encode/decode via orjson
+    engine_kwargs["json_serializer"] = lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    engine_kwargs["json_deserializer"] = orjson.loads
 if is_sqlite:
     engine_kwargs["connect_args"] = {"check_same_thread": False}
 else:
     engine_kwargs["pool_size"] = 5
     engine_kwargs["max_overflow"] = 10
+    if make_url(db_url).get_driver_name() == "psycopg2":
+        # Batch executemany UPDATEs (seed_db's bulk update) too, not just INSERTs
+        engine_kwargs["executemany_mode"] = "values_plus_batch"
 
 engine = create_engine(db_url, **engine_kwargs)
+
+if is_sqlite:
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_conn, _record):
+        # WAL lets API reads run during a seed/scan write; NORMAL only fsyncs at checkpoints
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 Base = declarative_base()
 
@@ -7,24 +7,38 @@ Usage:
 import argparse
 import json
 import os
-from datetime import datetime
+import re
+from collections import Counter
+from datetime import datetime, timezone
+from operator import mul
 from loguru import logger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from scrapers.earnings        import search_edgar_transcripts, scrape_ir_page_transcripts
 from scrapers.jobs            import scrape_careers_page
-from scrapers.tech_stack      import detect_tech_stack
+from scrapers.tech_stack      import scan_homepage, build_tech_stack
 from scrapers.github_scraper  import scrape_github_org, find_github_org
 from scrapers.financials      import (
     scrape_yahoo_finance, scrape_layoff_news,
     scrape_funding_news, compute_fiscal_pressure
 )
 from scrapers.press_releases  import scrape_press_releases
+from utils import cache
 from models.schema import (
     init_db, Company, EarningsTranscript, JobPosting,
     TechStack, GithubData, FinancialData, LayoffEvent,
     FundingRound, PressRelease
 )
 
+TRANSCRIPT_PIVOT_TERMS = ("ai-first", "strategic", "transformation", "pivot",
+                          "expand", "realign", "generative", "agentic")
+_TRANSCRIPT_PIVOT_RE = re.compile("|".join(map(re.escape, TRANSCRIPT_PIVOT_TERMS)), re.I)
+
 
 def analyze_company(
     company_name: str,
@@ -45,7 +59,7 @@ def analyze_company(
         "company_name": company_name,
         "domain":       domain,
         "is_public":    ticker is not None,
-        "analyzed_at":  datetime.utcnow().isoformat(),
+        "analyzed_at":  datetime.now(timezone.utc).isoformat(timespec="seconds"),
     }
 
     # ── 1. Earnings Transcripts ───────────────────────────────────────
@@ -67,32 +81,43 @@ def analyze_company(
     jobs = scrape_careers_page(careers, company_name, limit=30)
     profile["job_postings"] = jobs
 
-    pivot_kws, tech_debt_kws, fiscal_kws = [], [], []
-    dept_counts = {}
+    pivot_kws, tech_debt_kws, fiscal_kws = set(), set(), set()
+    dept_counts = Counter()
     for j in jobs:
         kw = j.get("keywords", {})
-        pivot_kws     += kw.get("pivot", [])
-        tech_debt_kws += kw.get("tech_debt", [])
-        fiscal_kws    += kw.get("fiscal", [])
+        pivot_kws.update(kw.get("pivot", []))
+        tech_debt_kws.update(kw.get("tech_debt", []))
+        fiscal_kws.update(kw.get("fiscal", []))
 
-        dept = j.get("department", "Other")
-        dept_counts[dept] = dept_counts.get(dept, 0) + 1
+        dept_counts[j.get("department", "Other")] += 1
+
+    # Frozen once here and shared by both scorers below
+    kw_index = {
+        "pivot":     frozenset(pivot_kws),
+        "tech_debt": frozenset(tech_debt_kws),
+        "fiscal":    frozenset(fiscal_kws),
+    }
 
     profile["hiring_signals"] = {
-        "pivot_keywords":     list(set(pivot_kws)),
-        "tech_debt_keywords": list(set(tech_debt_kws)),
-        "fiscal_keywords":    list(set(fiscal_kws)),
+        "pivot_keywords":     list(pivot_kws),
+        "tech_debt_keywords": list(tech_debt_kws),
+        "fiscal_keywords":    list(fiscal_kws),
         "total_jobs":         len(jobs),
-        "departments":        dict(sorted(dept_counts.items(), key=lambda x: x[1], reverse=True)),
-        "engineering_ratio":  round(dept_counts.get("Engineering", 0) / max(len(jobs), 1), 2),
+        "departments":        dict(dept_counts.most_common()),
+        "engineering_ratio":  round(dept_counts["Engineering"] / max(len(jobs), 1), 2),
     }
-    logger.success(f"  → {len(jobs)} jobs | Pivot: {list(set(pivot_kws))[:5]}")
+    # opt(lazy=True): the slicing/dict walks below only run if the sink is enabled
+    logger.opt(lazy=True).success("  → {} jobs | Pivot: {}",
+        lambda: len(jobs), lambda: list(pivot_kws)[:5])
 
     # ── 3. Tech Stack ─────────────────────────────────────────────────
     logger.info("[3/7] Tech stack detection...")
-    stack = detect_tech_stack(domain, company_name)
+    # Only the raw scan is cached — a failed fetch returns None and isn't stored
+    stack = build_tech_stack(domain, company_name, scan_homepage(domain, company_name))
     profile["tech_stack"] = stack
-    logger.success(f"  → {stack.get('frameworks', [])} | Legacy: {stack.get('debt_signals',{}).get('detected_legacy_tech',[])}")
+    logger.opt(lazy=True).success("  → {} | Legacy: {}",
+        lambda: stack.get("frameworks", []),
+        lambda: stack.get("debt_signals", {}).get("detected_legacy_tech", []))
 
     # ── 4. GitHub ─────────────────────────────────────────────────────
     logger.info("[4/7] GitHub analysis...")
@@ -101,7 +126,10 @@ def analyze_company(
     gh_data = {}
     if github_org:
         gh_data = scrape_github_org(github_org, company_name)
-        logger.success(f"  → {gh_data.get('total_repos',0)} repos | {gh_data.get('total_open_issues',0)} issues | Debt: {gh_data.get('github_debt',{}).get('label')}")
+        logger.opt(lazy=True).success("  → {} repos | {} issues | Debt: {}",
+            lambda: gh_data.get("total_repos", 0),
+            lambda: gh_data.get("total_open_issues", 0),
+            lambda: gh_data.get("github_debt", {}).get("label"))
 
     else:
         logger.info("  → No GitHub org found")
@@ -130,20 +158,22 @@ def analyze_company(
     news_page = news_url or f"https://{domain}/news"
     press = scrape_press_releases(company_name, domain, news_page, limit=20)
     profile["press_releases"] = press
+    press_pivot = {s for pr in press for s in pr.get("pivot_signals", [])}
     logger.success(f"  → {len(press)} press releases")
 
     # ── Composite Scores ──────────────────────────────────────────────
     profile["fiscal_pressure"] = compute_fiscal_pressure(financials, layoffs, funding)
-    profile["technical_debt"]  = _compute_tech_debt_score(stack, gh_data, jobs)
-    profile["recent_pivot"]    = _compute_pivot_score(press, jobs, transcripts)
+    profile["technical_debt"]  = _compute_tech_debt_score(stack, gh_data, kw_index)
+    profile["recent_pivot"]    = _compute_pivot_score(press_pivot, kw_index, transcripts)
     profile["opportunity_score"] = _compute_opportunity_score(profile)
     profile["llm_ready_summary"] = _build_llm_summary(profile)
 
     logger.success(f"\n✓ {company_name} complete")
-    logger.info(f"  Fiscal Pressure : {profile['fiscal_pressure']['fiscal_pressure_score']}/10  ({profile['fiscal_pressure']['fiscal_pressure_label']})")
-    logger.info(f"  Technical Debt  : {profile['technical_debt']['score']}/10  ({profile['technical_debt']['label']})")
-    logger.info(f"  Pivot Activity  : {profile['recent_pivot']['score']}/10  ({profile['recent_pivot']['label']})")
-    logger.info(f"  Opportunity     : {profile['opportunity_score']}/10")
+    fp, td, rp = profile["fiscal_pressure"], profile["technical_debt"], profile["recent_pivot"]
+    logger.info("  Fiscal Pressure : {}/10  ({})", fp["fiscal_pressure_score"], fp["fiscal_pressure_label"])
+    logger.info("  Technical Debt  : {}/10  ({})", td["score"], td["label"])
+    logger.info("  Pivot Activity  : {}/10  ({})", rp["score"], rp["label"])
+    logger.info("  Opportunity     : {}/10", profile["opportunity_score"])
 
     if save_to_db and db_session:
         _persist_to_db(profile, db_session)
@@ -153,8 +183,9 @@ def analyze_company(
 
 # ── Scoring ───────────────────────────────────────────────────────────────────
 
-def _compute_tech_debt_score(stack: dict, gh: dict, jobs: list[dict]) -> dict:
+def _compute_tech_debt_score(stack: dict, gh: dict, kw_index: dict[str, frozenset]) -> dict:
     score, signals = 0, []
+    debt_kws = kw_index["tech_debt"]
 
     legacy = stack.get("debt_signals", {}).get("detected_legacy_tech", [])
     if legacy:
@@ -170,33 +201,31 @@ def _compute_tech_debt_score(stack: dict, gh: dict, jobs: list[dict]) -> dict:
         if legacy_repos:
             signals.append(f"Legacy repos: {[r['signal'] for r in legacy_repos[:3]]}")
 
-    debt_kws = list(set(k for j in jobs for k in j.get("keywords", {}).get("tech_debt", [])))
     if debt_kws:
         score += min(4, len(debt_kws))
-        signals.append(f"Modernisation hiring: {debt_kws[:5]}")
+        signals.append(f"Modernisation hiring: {list(debt_kws)[:5]}")
 
     score = min(10, score)
     return {"score": score, "label": _label(score), "signals": signals}
 
 
-def _compute_pivot_score(press: list, jobs: list, transcripts: list) -> dict:
+def _compute_pivot_score(press_pivot: set[str], kw_index: dict[str, frozenset],
+                         transcripts: list) -> dict:
     score, signals = 0, []
+    pivot_kws = kw_index["pivot"]
 
-    all_pr = list(set(s for pr in press for s in pr.get("pivot_signals", [])))
-    if all_pr:
-        score += min(4, len(all_pr))
-        signals.append(f"Press signals: {all_pr[:6]}")
+    if press_pivot:
+        score += min(4, len(press_pivot))
+        signals.append(f"Press signals: {list(press_pivot)[:6]}")
 
-    pivot_kws = list(set(k for j in jobs for k in j.get("keywords", {}).get("pivot", [])))
     if pivot_kws:
         score += min(4, len(pivot_kws))
-        signals.append(f"Hiring pivot: {pivot_kws[:5]}")
+        signals.append(f"Hiring pivot: {list(pivot_kws)[:5]}")
 
+    # One regex scan per transcript; counts each distinct term once, as before
     pivot_count = sum(
-        1 for t in transcripts
-        for term in ["ai-first","strategic","transformation","pivot",
-                     "expand","realign","generative","agentic"]
-        if term in t.get("raw_text","").lower()
+        len({m.lower() for m in _TRANSCRIPT_PIVOT_RE.findall(t.get("raw_text", ""))})
+        for t in transcripts
     )
     if pivot_count:
         score += min(2, pivot_count // 2)
@@ -219,6 +248,15 @@ def _compute_opportunity_score(profile: dict) -> float:
     Tech debt = pain point to sell against.
     Hiring volume = budget open.
     """
+    score = sum(map(mul, _opportunity_features(profile), OPPORTUNITY_WEIGHTS))
+    return round(min(10, score), 2)
+
+
+# pivot, debt, fiscal, funded, hiring, layoffs — same order as _opportunity_features
+OPPORTUNITY_WEIGHTS = (0.35, 0.20, 0.15, 0.15, 0.10, 0.05)
+
+
+def _opportunity_features(profile: dict) -> tuple:
     fiscal  = profile["fiscal_pressure"]["fiscal_pressure_score"]
     debt    = profile["technical_debt"]["score"]
     pivot   = profile["recent_pivot"]["score"]
@@ -233,15 +271,7 @@ def _compute_opportunity_score(profile: dict) -> float:
 
     hiring_bonus = min(2, jobs / 15)
 
-    score = (
-        pivot          * 0.35 +
-        debt           * 0.20 +
-        fiscal_signal  * 0.15 +
-        funded_bonus   * 0.15 +
-        hiring_bonus   * 0.10 +
-        min(10, layoffs * 2) * 0.05
-    )
-    return round(min(10, score), 2)
+    return (pivot, debt, fiscal_signal, funded_bonus, hiring_bonus, min(10, layoffs * 2))
 
 
 def _label(score: int) -> str:
@@ -252,37 +282,43 @@ def _label(score: int) -> str:
     return "Minimal"
 
 
-def _build_llm_summary(profile: dict) -> dict:
-    hs = profile.get("hiring_signals", {})
-    gh = profile.get("github", {})
-
-    # Collect trigger signals: layoffs + strong pivot press releases
-    trigger_signals = []
+def _iter_trigger_signals(profile: dict):
+    """Trigger headlines in priority order: layoffs, pivot press releases, big rounds."""
     for l in profile.get("layoffs", [])[:3]:
-        trigger_signals.append(l.get("headline", ""))
+        yield l.get("headline", "")
     for pr in profile.get("press_releases", []):
         if pr.get("pivot_signals"):
-            trigger_signals.append(pr.get("title", ""))
+            yield pr.get("title", "")
     for f in profile.get("funding", [])[:2]:
         if f.get("amount_usd") and f["amount_usd"] > 100_000_000:
-            trigger_signals.append(f.get("headline", ""))
+            yield f.get("headline", "")
 
-    top_funding = profile.get("funding", [])
-    funding_status = (
-        top_funding[0].get("headline", "Unknown")[:100]
-        if top_funding else "Unknown"
-    )
+
+def _build_llm_summary(profile: dict) -> dict:
+    hs = profile.get("hiring_signals", {})
+    gh = profile.get("github", {})
+    fp, td, rp = profile["fiscal_pressure"], profile["technical_debt"], profile["recent_pivot"]
+    funding = profile.get("funding", [])
+
+    # Ordered dedup; stop scanning as soon as the top 5 are filled
+    trigger_signals = {}
+    for headline in _iter_trigger_signals(profile):
+        trigger_signals[headline] = None
+        if len(trigger_signals) >= 5:
+            break
+
+    funding_status = funding[0].get("headline", "Unknown")[:100] if funding else "Unknown"
 
     return {
         "company_name":          profile["company_name"],
-        "fiscal_pressure_score": profile["fiscal_pressure"]["fiscal_pressure_score"],
-        "fiscal_signals":        profile["fiscal_pressure"]["signals"],
-        "technical_debt_score":  profile["technical_debt"]["score"],
-        "debt_signals":          profile["technical_debt"]["signals"],
-        "recent_pivot":          profile["recent_pivot"]["signals"],
-        "pivot_score":           profile["recent_pivot"]["score"],
+        "fiscal_pressure_score": fp["fiscal_pressure_score"],
+        "fiscal_signals":        fp["signals"],
+        "technical_debt_score":  td["score"],
+        "debt_signals":          td["signals"],
+        "recent_pivot":          rp["signals"],
+        "pivot_score":           rp["score"],
         "funding_status":        funding_status,
-        "trigger_signals":       list(dict.fromkeys(trigger_signals))[:5],  # dedup, top 5
+        "trigger_signals":       list(trigger_signals),
         "revenue_trend":         "public" if profile.get("is_public") else "private",
         "trigger_recency_days":  30,
         "total_jobs_posted":     hs.get("total_jobs", 0),
@@ -300,32 +336,39 @@ def _persist_to_db(profile: dict, session):
     try:
         if not session.query(Company).filter_by(name=name).first():
             session.add(Company(name=name, domain=profile["domain"]))
-        for t in profile.get("transcripts", []):
-            session.add(EarningsTranscript(company_name=name, quarter=t.get("quarter",""),
-                raw_text=t.get("raw_text",""), source_url=t.get("source_url","")))
-        for j in profile.get("job_postings", []):
-            session.add(JobPosting(company_name=name, role_title=j.get("role_title",""),
-                department=j.get("department",""), description=j.get("description",""),
-                keywords=j.get("keywords",{}), posted_date=j.get("posted_date",""),
-                source=j.get("source","")))
-        for f in profile.get("financials", []):
-            session.add(FinancialData(company_name=name, ticker=f.get("ticker",""),
-                quarter=f.get("quarter",""), revenue=f.get("revenue"),
-                operating_margin=f.get("operating_margin"),
-                gross_margin=f.get("gross_margin"),
-                net_income=f.get("net_income"), source=f.get("source","")))
-        for l in profile.get("layoffs", []):
-            session.add(LayoffEvent(company_name=name, date=l.get("date",""),
-                headcount=l.get("headcount"), percentage=l.get("percentage"),
-                source_url=l.get("source_url","")))
-        for f in profile.get("funding", []):
-            session.add(FundingRound(company_name=name, round_type=f.get("round_type",""),
-                amount_usd=f.get("amount_usd"), date=f.get("date",""),
-                investors=f.get("investors",[]), source_url=f.get("source_url","")))
-        for pr in profile.get("press_releases", []):
-            session.add(PressRelease(company_name=name, title=pr.get("title",""),
-                content=pr.get("content",""), published_date=pr.get("published_date",""),
-                source_url=pr.get("source_url","")))
+        # One executemany INSERT per table instead of per-row ORM units of work
+        session.bulk_insert_mappings(EarningsTranscript, [
+            dict(company_name=name, quarter=t.get("quarter",""),
+                 raw_text=t.get("raw_text",""), source_url=t.get("source_url",""))
+            for t in profile.get("transcripts", [])])
+        session.bulk_insert_mappings(JobPosting, [
+            dict(company_name=name, role_title=j.get("role_title",""),
+                 department=j.get("department",""), description=j.get("description",""),
+                 keywords=j.get("keywords",{}), posted_date=j.get("posted_date",""),
+                 source=j.get("source",""))
+            for j in profile.get("job_postings", [])])
+        session.bulk_insert_mappings(FinancialData, [
+            dict(company_name=name, ticker=f.get("ticker",""),
+                 quarter=f.get("quarter",""), revenue=f.get("revenue"),
+                 operating_margin=f.get("operating_margin"),
+                 gross_margin=f.get("gross_margin"),
+                 net_income=f.get("net_income"), source=f.get("source",""))
+            for f in profile.get("financials", [])])
+        session.bulk_insert_mappings(LayoffEvent, [
+            dict(company_name=name, date=l.get("date",""),
+                 headcount=l.get("headcount"), percentage=l.get("percentage"),
+                 source_url=l.get("source_url",""))
+            for l in profile.get("layoffs", [])])
+        session.bulk_insert_mappings(FundingRound, [
+            dict(company_name=name, round_type=f.get("round_type",""),
+                 amount_usd=f.get("amount_usd"), date=f.get("date",""),
+                 investors=f.get("investors",[]), source_url=f.get("source_url",""))
+            for f in profile.get("funding", [])])
+        session.bulk_insert_mappings(PressRelease, [
+            dict(company_name=name, title=pr.get("title",""),
+                 content=pr.get("content",""), published_date=pr.get("published_date",""),
+                 source_url=pr.get("source_url",""))
+            for pr in profile.get("press_releases", [])])
         session.commit()
         logger.success(f"[{name}] Saved to DB")
     except Exception as e:
@@ -333,6 +376,19 @@ def _persist_to_db(profile: dict, session):
         logger.error(f"DB save failed: {e}")
 
 
+# ── Output ────────────────────────────────────────────────────────────────────
+
+def _write_json(path: str, data):
+    """Dump profiles with orjson (C, bytes straight to disk) when available."""
+    if HAS_ORJSON:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, default=str,
+                                 option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2, default=str)
+
+
 # ── Demo companies ────────────────────────────────────────────────────────────
 
 DEMO_COMPANIES = [
@@ -344,18 +400,23 @@ DEMO_COMPANIES = [
 ]
 
 
+# Built once at import so embedding callers can reuse it (_PARSER.parse_args(argv))
+_PARSER = argparse.ArgumentParser(description="DataVex B2B Intelligence Scraper")
+_PARSER.add_argument("--company",  help="Company name")
+_PARSER.add_argument("--domain",   help="Company domain")
+_PARSER.add_argument("--ticker",   help="Stock ticker")
+_PARSER.add_argument("--github",   help="GitHub org slug")
+_PARSER.add_argument("--careers",  help="Careers page URL")
+_PARSER.add_argument("--ir",       help="Investor relations URL")
+_PARSER.add_argument("--news",     help="News page URL")
+_PARSER.add_argument("--demo",     action="store_true")
+_PARSER.add_argument("--output",   default="profile.json")
+_PARSER.add_argument("--no-cache", action="store_true", help="Ignore today's cached scrapes")
+
+
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="DataVex B2B Intelligence Scraper")
-    parser.add_argument("--company",  help="Company name")
-    parser.add_argument("--domain",   help="Company domain")
-    parser.add_argument("--ticker",   help="Stock ticker")
-    parser.add_argument("--github",   help="GitHub org slug")
-    parser.add_argument("--careers",  help="Careers page URL")
-    parser.add_argument("--ir",       help="Investor relations URL")
-    parser.add_argument("--news",     help="News page URL")
-    parser.add_argument("--demo",     action="store_true")
-    parser.add_argument("--output",   default="profile.json")
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
+    cache.set_enabled(not args.no_cache)
 
     SessionFactory = init_db()
     session = SessionFactory()
@@ -365,8 +426,7 @@ if __name__ == "__main__":
         for c in DEMO_COMPANIES:
             p = analyze_company(**c, db_session=session, save_to_db=True)
             profiles.append(p)
-        with open("demo_profiles.json", "w") as f:
-            json.dump(profiles, f, indent=2, default=str)
+        _write_json("demo_profiles.json", profiles)
         logger.success("Done → demo_profiles.json")
 
     elif args.company and args.domain:
@@ -376,8 +436,7 @@ if __name__ == "__main__":
             careers_url=args.careers, ir_url=args.ir, news_url=args.news,
             db_session=session, save_to_db=True,
         )
-        with open(args.output, "w") as f:
-            json.dump(profile, f, indent=2, default=str)
+        _write_json(args.output, profile)
         logger.success(f"Done → {args.output}")
     else:
-        parser.print_help()
+        _PARSER.print_help()
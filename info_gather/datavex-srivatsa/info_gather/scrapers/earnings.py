@@ -10,12 +10,14 @@ from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 from loguru import logger
 from utils.http import safe_get, get_session, extract_text_from_pdf_bytes
+from utils.cache import cached, DAY
 
 
 EDGAR_SEARCH = "https://efts.sec.gov/LATEST/search-index?q=%22earnings+call%22&dateRange=custom&startdt={start}&enddt={end}&entity={ticker}&forms=8-K"
 EDGAR_FILING  = "https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK={ticker}&type=8-K&dateb=&owner=include&count=10&search_text="
 
 
+@cached(ttl=DAY)
 def search_edgar_transcripts(ticker: str, limit: int = 4) -> list[dict]:
     """
     Fetch 8-K filings from SEC EDGAR for a ticker.
@@ -77,6 +79,7 @@ def _extract_text_from_filing_page(filing_index_url: str, session) -> tuple[str,
     return "", filing_index_url
 
 
+@cached(ttl=DAY)
 def scrape_ir_page_transcripts(ir_url: str, company_name: str) -> list[dict]:
     """
     Crawl a company's Investor Relations page looking for:
@@ -7,6 +7,7 @@ import re
 import feedparser
 from loguru import logger
 from utils.http import safe_get, get_session
+from utils.cache import cached, HOUR
 
 YAHOO_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary/{ticker}?modules=incomeStatementHistory,cashflowStatementHistory,financialData,defaultKeyStatistics"
 
@@ -27,6 +28,7 @@ REVENUE_INDICATORS = [
 ]
 
 
+@cached(ttl=6 * HOUR)
 def scrape_yahoo_finance(ticker: str, company_name: str) -> list[dict]:
     session = get_session()
     results = []
@@ -56,6 +58,7 @@ def scrape_yahoo_finance(ticker: str, company_name: str) -> list[dict]:
     return results
 
 
+@cached(ttl=HOUR)
 def scrape_layoff_news(company_name: str, domain: str = "") -> list[dict]:
     results = []
     queries = [
@@ -100,6 +103,7 @@ def scrape_layoff_news(company_name: str, domain: str = "") -> list[dict]:
     return results
 
 
+@cached(ttl=HOUR)
 def scrape_funding_news(company_name: str) -> list[dict]:
     results = []
     queries = [
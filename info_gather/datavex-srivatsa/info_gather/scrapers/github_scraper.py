@@ -5,30 +5,43 @@ Skips commit activity stats (slow API) — uses repo metadata only.
 """
 import os
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from loguru import logger
+from utils.cache import cached, DAY
 
 try:
     from github import Github, GithubException, RateLimitExceededException
 except ImportError:
     Github = None
 
-LEGACY_REPO_SIGNALS = [
+LEGACY_REPO_SIGNALS = (
     "legacy", "deprecated", "old-", "v1", "monolith", "migration",
     "archive", "technical-debt", "refactor", "rewrite"
-]
+)
+# One scan per repo; the lookahead also reports signals that overlap another hit
+_LEGACY_RE = re.compile("(?=(" + "|".join(map(re.escape, LEGACY_REPO_SIGNALS)) + "))")
 MAX_REPOS = 20
+REPO_WORKERS = 8   # concurrent get_languages() calls
 
 
 def scrape_github_org(org_name: str, company_name: str, token: str | None = None) -> dict:
+    """Summarise an org's public repos; an all-zero summary when GitHub is skipped or fails."""
+    return _scan_org(org_name, company_name, token) or _empty(company_name, org_name)
+
+
+@cached(ttl=DAY)
+def _scan_org(org_name: str, company_name: str, token: str | None = None) -> dict | None:
+    """Returns None when GitHub is skipped or the call fails, so the miss isn't cached."""
     if Github is None:
         logger.error("PyGithub not installed.")
-        return _empty(company_name, org_name)
+        return None
 
     token = token or os.getenv("GITHUB_TOKEN")
     if not token:
         logger.warning(f"[{company_name}] No GITHUB_TOKEN in .env — GitHub skipped")
-        return _empty(company_name, org_name)
+        return None
 
     # retry=None prevents urllib3 from sleeping on 403s
     gh = Github(token, timeout=10, retry=None)
@@ -37,34 +50,36 @@ def scrape_github_org(org_name: str, company_name: str, token: str | None = None
         rate = gh.get_rate_limit()
         if rate.core.remaining < 30:
             logger.warning(f"[{company_name}] GitHub rate limit low ({rate.core.remaining} left) — skipping")
-            return _empty(company_name, org_name)
+            return None
 
         org   = gh.get_organization(org_name)
         repos = list(org.get_repos(type="public", sort="updated"))[:MAX_REPOS]
 
         total_open_issues = 0
-        languages         = {}
+        languages         = Counter()
         legacy_signals    = []
         repo_summaries    = []
         stale_count       = 0
 
-        for repo in repos:
+        # One languages call per repo — overlap them instead of paying each RTT in turn
+        with ThreadPoolExecutor(max_workers=REPO_WORKERS) as ex:
+            repo_langs = list(ex.map(_repo_languages, repos))
+
+        now = datetime.now(timezone.utc)
+        for repo, langs in zip(repos, repo_langs):
             total_open_issues += repo.open_issues_count
 
             # Languages — quick metadata call
-            try:
-                for lang, b in repo.get_languages().items():
-                    languages[lang] = languages.get(lang, 0) + b
-            except Exception:
-                pass
+            languages.update(langs)
 
             # Legacy signals from repo name + description (no API call)
             repo_text = (repo.name + " " + (repo.description or "")).lower()
-            for signal in LEGACY_REPO_SIGNALS:
-                if signal in repo_text:
-                    legacy_signals.append({"repo": repo.name, "signal": signal})
+            hits = set(_LEGACY_RE.findall(repo_text))
+            legacy_signals.extend(
+                {"repo": repo.name, "signal": signal} for signal in LEGACY_REPO_SIGNALS if signal in hits
+            )
 
-            days_since = (datetime.now(timezone.utc) - repo.updated_at).days if repo.updated_at else 999
+            days_since = (now - repo.updated_at).days if repo.updated_at else 999
             if days_since > 180:
                 stale_count += 1
 
@@ -76,7 +91,7 @@ def scrape_github_org(org_name: str, company_name: str, token: str | None = None
                 "language":          repo.language,
             })
 
-        top_langs = [l for l, _ in sorted(languages.items(), key=lambda x: x[1], reverse=True)[:10]]
+        top_langs = [l for l, _ in languages.most_common(10)]
         debt      = _assess_debt(total_open_issues, len(repos), legacy_signals, stale_count)
 
         logger.success(f"[{company_name}] GitHub: {len(repos)} repos | {total_open_issues} issues | debt={debt['label']}")
@@ -95,18 +110,26 @@ def scrape_github_org(org_name: str, company_name: str, token: str | None = None
 
     except RateLimitExceededException:
         logger.warning(f"[{company_name}] GitHub rate limit hit — skipping")
-        return _empty(company_name, org_name)
+        return None
     except GithubException as e:
         if e.status == 404:
             logger.warning(f"[{company_name}] GitHub org '{org_name}' not found")
         else:
             logger.warning(f"[{company_name}] GitHub error {e.status}: {e.data}")
-        return _empty(company_name, org_name)
+        return None
     except Exception as e:
         logger.warning(f"[{company_name}] GitHub failed: {e}")
-        return _empty(company_name, org_name)
+        return None
+
+
+def _repo_languages(repo) -> dict:
+    try:
+        return repo.get_languages()
+    except Exception:
+        return {}
 
 
+@cached(ttl=DAY)
 def find_github_org(company_name: str) -> str | None:
     if Github is None or not os.getenv("GITHUB_TOKEN"):
         return None
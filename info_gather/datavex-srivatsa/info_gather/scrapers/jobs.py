@@ -7,6 +7,7 @@ from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from loguru import logger
 from utils.http import safe_get, quick_get, get_session
+from utils.cache import cached, HOUR
 
 GREENHOUSE_API = "https://boards-api.greenhouse.io/v1/boards/{slug}/jobs?content=true"
 LEVER_API      = "https://api.lever.co/v0/postings/{slug}?mode=json"
@@ -29,9 +30,11 @@ FISCAL_KEYWORDS = [
 ]
 
 
-def scrape_careers_page(careers_url: str, company_name: str, limit: int = 30) -> list[dict]:
+@cached(ttl=2 * HOUR)
+def scrape_careers_page(careers_url: str, company_name: str, limit: int = 30,
+                        session=None) -> list[dict]:
     slugs   = _generate_slugs(careers_url, company_name)
-    session = get_session()
+    session = session or get_session()
 
     logger.debug(f"[{company_name}] Trying slugs: {slugs}")
 
@@ -8,6 +8,7 @@ from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from loguru import logger
 from utils.http import safe_get, get_session
+from utils.cache import cached, HOUR
 
 GOOGLE_NEWS_RSS = "https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
 
@@ -31,18 +32,21 @@ NOISE_PATTERNS = [
 ]
 
 
+@cached(ttl=HOUR)
 def scrape_press_releases(
     company_name: str,
     domain: str,
     news_page_url: str | None = None,
     limit: int = 20,
+    session=None,
 ) -> list[dict]:
     results = []
+    session = session or get_session()
 
-    results.extend(_try_rss_feeds(domain, company_name))
+    results.extend(_try_rss_feeds(domain, company_name, session))
 
     if news_page_url and len(results) < limit:
-        results.extend(_scrape_news_page(news_page_url, company_name))
+        results.extend(_scrape_news_page(news_page_url, company_name, session))
 
     if len(results) < 5:
         results.extend(_scrape_google_news(company_name, domain))
@@ -75,9 +79,8 @@ def scrape_press_releases(
     return unique[:limit]
 
 
-def _try_rss_feeds(domain: str, company_name: str) -> list[dict]:
+def _try_rss_feeds(domain: str, company_name: str, session) -> list[dict]:
     results = []
-    session = get_session()
     base = domain if domain.startswith("http") else f"https://{domain}"
     rss_paths = [
         "/feed", "/rss", "/news/feed", "/blog/feed", "/press/rss",
@@ -107,9 +110,8 @@ def _try_rss_feeds(domain: str, company_name: str) -> list[dict]:
     return results
 
 
-def _scrape_news_page(news_url: str, company_name: str) -> list[dict]:
+def _scrape_news_page(news_url: str, company_name: str, session) -> list[dict]:
     results = []
-    session = get_session()
     try:
         resp = safe_get(news_url, session)
         soup = BeautifulSoup(resp.text, "lxml")
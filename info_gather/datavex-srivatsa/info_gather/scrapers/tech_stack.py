@@ -9,6 +9,7 @@ import re
 from bs4 import BeautifulSoup
 from loguru import logger
 from utils.http import safe_get, get_session
+from utils.cache import cached, DAY
 
 
 # Fingerprint rules: (pattern_in_html_or_header, tech_name, is_legacy)
@@ -65,47 +66,62 @@ def detect_tech_stack(domain: str, company_name: str) -> dict:
     Fetch company homepage and detect tech stack.
     Returns structured dict ready for DB insertion.
     """
-    url = _normalize_url(domain)
-    session = get_session()
-    frameworks, languages, raw_headers, debt_signals = [], [], {}, []
+    return build_tech_stack(domain, company_name, scan_homepage(domain, company_name))
+
 
+@cached(ttl=DAY)
+def scan_homepage(domain: str, company_name: str) -> dict | None:
+    """
+    Fingerprint the homepage's HTML and headers.
+    Returns None when the fetch fails, so callers don't cache a failed scan.
+    """
+    url = _normalize_url(domain)
     try:
-        resp = safe_get(url, session, timeout=15)
-        html  = resp.text
-        headers_lower = {k.lower(): v.lower() for k, v in resp.headers.items()}
+        resp = safe_get(url, get_session(), timeout=15)
+    except Exception as e:
+        logger.warning(f"Tech stack detect failed ({domain}): {e}")
+        return None
 
-        # Combine HTML + headers for scanning
-        combined = html + " " + str(headers_lower)
+    html  = resp.text
+    headers_lower = {k.lower(): v.lower() for k, v in resp.headers.items()}
 
-        detected = _run_fingerprints(combined)
-        frameworks = [d["tech"] for d in detected]
-        debt_signals = [d["tech"] for d in detected if d["is_legacy"]]
+    # Combine HTML + headers for scanning
+    combined = html + " " + str(headers_lower)
 
-        # Extract inline languages from script src
-        languages = _detect_languages(html, headers_lower)
+    detected = _run_fingerprints(combined)
+    frameworks = [d["tech"] for d in detected]
+    debt_signals = [d["tech"] for d in detected if d["is_legacy"]]
+
+    logger.info(
+        f"[{company_name}] Stack: {frameworks} | Legacy signals: {debt_signals}"
+    )
 
+    return {
+        "frameworks":   frameworks,
+        "debt_signals": debt_signals,
+        # Extract inline languages from script src
+        "languages":    _detect_languages(html, headers_lower),
         # Save relevant headers
-        raw_headers = {
+        "raw_headers":  {
             k: headers_lower[k]
             for k in ["server", "x-powered-by", "x-frame-options", "content-type", "via"]
             if k in headers_lower
-        }
-
-        logger.info(
-            f"[{company_name}] Stack: {frameworks} | Legacy signals: {debt_signals}"
-        )
+        },
+    }
 
-    except Exception as e:
-        logger.warning(f"Tech stack detect failed ({domain}): {e}")
 
+def build_tech_stack(domain: str, company_name: str, scan: dict | None) -> dict:
+    """Shape a scan_homepage() result (or None) into the detect_tech_stack() dict."""
+    scan = scan or {}
+    debt_signals = scan.get("debt_signals", [])
     legacy_score = min(10, len(debt_signals) * 2.5)  # crude 0-10 score
 
     return {
         "company_name": company_name,
         "domain":       domain,
-        "frameworks":   frameworks,
-        "languages":    languages,
-        "raw_headers":  raw_headers,
+        "frameworks":   scan.get("frameworks", []),
+        "languages":    scan.get("languages", []),
+        "raw_headers":  scan.get("raw_headers", {}),
         "debt_signals": {
             "detected_legacy_tech": debt_signals,
             "legacy_score":         legacy_score,
@@ -0,0 +1,85 @@
+"""
+On-disk cache for scraper results — same API as info_gather/utils/cache.py.
+Each decorated scraper is keyed by (function, args, kwargs) and stored as
+gzipped JSON with a per-source TTL, so re-running a company skips the network.
+"""
+import functools
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from loguru import logger
+
+CACHE_DIR = os.getenv(
+    "SCRAPE_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".scrape_cache"),
+)
+
+HOUR = 3600
+DAY  = 24 * HOUR
+
+_enabled = True
+
+
+def set_enabled(enabled: bool):
+    """Turn the cache on/off for this process (e.g. from --no-cache)."""
+    global _enabled
+    _enabled = enabled
+
+
+def _path(func, args: tuple, kwargs: dict) -> str:
+    key    = json.dumps([func.__qualname__, args, sorted(kwargs.items())], default=str)
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{func.__module__}.{func.__qualname__}-{digest[:16]}.json.gz")
+
+
+def cached(ttl: int, keep_empty: bool = False):
+    """
+    Cache a scraper's return value on disk for ttl seconds.
+    Empty results are not cached — scrapers return [] / {} on failure —
+    unless keep_empty is set (probes where False is the answer).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+
+            path = _path(func, args, kwargs)
+            try:
+                if time.time() - os.path.getmtime(path) < ttl:
+                    with gzip.open(path, "rt", encoding="utf-8") as f:
+                        logger.debug(f"Cache hit: {func.__qualname__} {args}")
+                        return json.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug(f"Cache read failed ({path}): {e}")
+
+            result = func(*args, **kwargs)
+            if result or keep_empty:
+                try:
+                    _write_entry(path, result)
+                except Exception as e:
+                    logger.debug(f"Cache write failed ({path}): {e}")
+            return result
+        return wrapper
+    return decorator
+
+
+def _write_entry(path: str, data):
+    """
+    Write gzipped JSON to a unique temp file and rename it into place, so
+    concurrent readers never see a truncated entry and writers can't interleave.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -1,9 +1,18 @@
+import os
 import time
 import random
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import retry, stop_after_attempt, wait_exponential
 from loguru import logger
 
+# Seconds slept before each polite request; quick_get skips it
+POLITE_DELAY_RANGE = (0.5, 1.5)
+RETRY_ATTEMPTS     = 3
+RETRY_WAIT_MIN     = 2
+RETRY_WAIT_MAX     = 10
+
 HEADERS_POOL = [
     {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36",
@@ -19,17 +28,44 @@ HEADERS_POOL = [
     },
 ]
 
+def _polite_sleep():
+    time.sleep(random.uniform(*POLITE_DELAY_RANGE))
+
+
+_local = threading.local()
+
 def get_session() -> requests.Session:
-    session = requests.Session()
-    session.headers.update(random.choice(HEADERS_POOL))
+    """
+    Per-thread keep-alive Session shared by every scraper on that thread, so
+    repeat hits on a host (Google News, Yahoo, ATS APIs) reuse pooled connections
+    instead of a fresh TCP+TLS handshake per call. requests.Session isn't
+    thread-safe, so asyncio.to_thread / pool workers each get their own; the
+    worker threads are reused, so their pools stay warm. Rebuilt after a fork.
+    Retries are left to safe_get's tenacity policy so they don't compound.
+    """
+    session = getattr(_local, "session", None)
+    if session is None or _local.pid != os.getpid():
+        session = requests.Session()
+        session.headers.update(random.choice(HEADERS_POOL))
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _local.session, _local.pid = session, os.getpid()
     return session
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+def _rotate_headers(kwargs: dict):
+    # One pooled Session serves every host, so rotate the browser headers per request
+    kwargs["headers"] = {**random.choice(HEADERS_POOL), **(kwargs.get("headers") or {})}
+
+
+@retry(stop=stop_after_attempt(RETRY_ATTEMPTS),
+       wait=wait_exponential(multiplier=1, min=RETRY_WAIT_MIN, max=RETRY_WAIT_MAX))
 def safe_get(url: str, session: requests.Session | None = None, timeout: int = 20, **kwargs) -> requests.Response:
     """GET with retry — used for important pages like IR, careers HTML."""
-    time.sleep(random.uniform(0.5, 1.5))
+    _polite_sleep()
     s = session or get_session()
+    _rotate_headers(kwargs)
     resp = s.get(url, timeout=timeout, **kwargs)
     resp.raise_for_status()
     return resp
@@ -39,8 +75,10 @@ def quick_get(url: str, session: requests.Session | None = None, timeout: int =
     """
     GET with NO retry — used for ATS API probing where we try many slugs
     and expect most to 404. Fails immediately so we can move to next slug fast.
+    Use this rather than safe_get for any loop of more than ~5 probes per host.
     """
     s = session or get_session()
+    _rotate_headers(kwargs)
     resp = s.get(url, timeout=timeout, **kwargs)
     resp.raise_for_status()
     return resp
@@ -1,13 +1,43 @@
 from sqlalchemy import Column, String, Float, Integer, Text, DateTime, JSON, create_engine
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import declarative_base, sessionmaker
 from datetime import datetime
 from dotenv import load_dotenv
+import base64
+import gzip
 import os
 
 load_dotenv()
 
 Base = declarative_base()
 
+class GzipText(TypeDecorator):
+    """
+    Text column holding a gzip-compressed body, so long transcripts and press
+    releases take a fraction of the space. The stored value stays text
+    ("gz:" + base64), so the column is TEXT in every database and callers read
+    and write plain str. Values gzip doesn't shrink, and rows written before
+    compression, are kept as-is.
+    """
+    impl = Text
+    cache_ok = True
+    PREFIX = "gz:"
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        packed = self.PREFIX + base64.b64encode(
+            gzip.compress(value.encode("utf-8"), compresslevel=1, mtime=0)   # level 1: most of the ratio, ~3x faster
+        ).decode("ascii")
+        # A plain value that happens to start with the prefix must be packed to read back right
+        return packed if len(packed) < len(value) or value.startswith(self.PREFIX) else value
+
+    def process_result_value(self, value, dialect):
+        if value is None or not value.startswith(self.PREFIX):
+            return value
+        return gzip.decompress(base64.b64decode(value[len(self.PREFIX):])).decode("utf-8")
+
+
 class Company(Base):
     __tablename__ = "companies"
     id         = Column(Integer, primary_key=True)
@@ -21,7 +51,7 @@ class EarningsTranscript(Base):
     id           = Column(Integer, primary_key=True)
     company_name = Column(String(255))
     quarter      = Column(String(20))
-    raw_text     = Column(Text)
+    raw_text     = Column(GzipText)
     source_url   = Column(Text)
     scraped_at   = Column(DateTime, default=datetime.utcnow)
 
@@ -51,7 +81,7 @@ class PressRelease(Base):
     id             = Column(Integer, primary_key=True)
     company_name   = Column(String(255))
     title          = Column(Text)
-    content        = Column(Text)
+    content        = Column(GzipText)
     published_date = Column(String(50))
     source_url     = Column(Text)
     scraped_at     = Column(DateTime, default=datetime.utcnow)
@@ -124,12 +154,18 @@ class FundingRound(Base):
     scraped_at   = Column(DateTime, default=datetime.utcnow)
 
 
+_ENGINES: dict[str, object] = {}
+
 def get_engine(db_url: str | None = None):
     url = db_url or os.getenv("DATABASE_URL", "sqlite:///datavex.db")
     # Supabase / any postgresql:// URL needs the psycopg3 driver prefix
     if url.startswith("postgresql://"):
         url = url.replace("postgresql://", "postgresql+psycopg://", 1)
-    return create_engine(url, echo=False)
+    # One pooled engine per URL, shared by every session in the process
+    if url not in _ENGINES:
+        engine_kwargs = {} if url.startswith("sqlite") else {"pool_size": 5}
+        _ENGINES[url] = create_engine(url, echo=False, **engine_kwargs)
+    return _ENGINES[url]
 
 def init_db(db_url: str | None = None):
     engine = get_engine(db_url)
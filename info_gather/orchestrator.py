@@ -9,9 +9,19 @@ For hackathon demo mode (pre-load 5 companies):
 import argparse
 import json
 import os
-from datetime import datetime
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+from datetime import datetime, timezone
 from loguru import logger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Scrapers
 from scrapers.earnings        import search_edgar_transcripts, scrape_ir_page_transcripts
 from scrapers.jobs            import scrape_careers_page
@@ -22,6 +32,8 @@ from scrapers.financials      import (
     scrape_funding_news, compute_fiscal_pressure
 )
 from scrapers.press_releases  import scrape_press_releases
+from utils                    import cache
+from utils.http               import get_session
 
 # DB
 from models.schema import (
@@ -30,6 +42,9 @@ from models.schema import (
     FundingRound, PressRelease
 )
 
+TRANSCRIPT_PIVOT_TERMS = ("ai-first", "strategic", "transformation", "pivot", "expand", "realign")
+_TRANSCRIPT_PIVOT_RE = re.compile("|".join(map(re.escape, TRANSCRIPT_PIVOT_TERMS)), re.I)
+
 
 def analyze_company(
     company_name: str,
@@ -41,9 +56,13 @@ def analyze_company(
     news_url: str | None = None,
     db_session=None,
     save_to_db: bool = True,
+    sink=None,
 ) -> dict:
     """
     Full pipeline: scrape all sources for a company and return structured profile.
+    If a sink (e.g. ProfileSink) is given, each record list is handed to it as soon
+    as its stage completes and the profile keeps only counts and scores; the sink
+    is then responsible for persisting.
     """
     logger.info(f"\n{'='*60}")
     logger.info(f"Starting analysis: {company_name} ({domain})")
@@ -52,87 +71,99 @@ def analyze_company(
     profile = {
         "company_name": company_name,
         "domain": domain,
-        "analyzed_at": datetime.utcnow().isoformat(),
+        "analyzed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
     }
-
-    # ── 1. Earnings Transcripts ───────────────────────────────────────
-    logger.info("[1/7] Fetching earnings transcripts...")
-    transcripts = []
-    if ticker:
-        transcripts = search_edgar_transcripts(ticker, limit=4)
-    if ir_url and len(transcripts) < 2:
-        transcripts += scrape_ir_page_transcripts(ir_url, company_name)
-    profile["transcripts"] = transcripts
-    logger.success(f"  → {len(transcripts)} transcripts found")
-
-    # ── 2. Job Postings ───────────────────────────────────────────────
-    logger.info("[2/7] Scraping job postings...")
-    careers = careers_url or f"https://{domain}/careers"
-    jobs = scrape_careers_page(careers, company_name, limit=25)
-    profile["job_postings"] = jobs
-    logger.success(f"  → {len(jobs)} job postings found")
-
-    # Aggregate keyword signals across all jobs
-    pivot_kws    = []
-    tech_debt_kws = []
-    for j in jobs:
-        pivot_kws    += j.get("keywords", {}).get("pivot", [])
-        tech_debt_kws += j.get("keywords", {}).get("tech_debt", [])
-    profile["hiring_signals"] = {
-        "pivot_keywords":     list(set(pivot_kws)),
-        "tech_debt_keywords": list(set(tech_debt_kws)),
-        "total_jobs":         len(jobs),
-        "departments":        _count_departments(jobs),
-    }
-
-    # ── 3. Tech Stack ─────────────────────────────────────────────────
-    logger.info("[3/7] Detecting tech stack...")
-    stack = detect_tech_stack(domain, company_name)
-    profile["tech_stack"] = stack
-    logger.success(f"  → Frameworks: {stack.get('frameworks', [])}")
-
-    # ── 4. GitHub ─────────────────────────────────────────────────────
-    logger.info("[4/7] Scanning GitHub...")
-    if not github_org:
-        github_org = find_github_org(company_name)
-    gh_data = {}
-    if github_org:
-        gh_data = scrape_github_org(github_org, company_name)
-    profile["github"] = gh_data
-    logger.success(f"  → {gh_data.get('total_repos', 0)} repos, "
-                   f"{gh_data.get('total_open_issues', 0)} open issues")
-
-    # ── 5. Financials ─────────────────────────────────────────────────
-    logger.info("[5/7] Fetching financial data...")
-    financials = []
-    if ticker:
-        financials = scrape_yahoo_finance(ticker, company_name)
-    profile["financials"] = financials
-    logger.success(f"  → {len(financials)} quarters of data")
-
-    # ── 6. Layoffs & Funding ──────────────────────────────────────────
-    logger.info("[6/7] Checking layoffs & funding...")
-    layoffs  = scrape_layoff_news(company_name)
-    funding  = scrape_funding_news(company_name)
-    profile["layoffs"]  = layoffs
-    profile["funding"]  = funding
-    logger.success(f"  → {len(layoffs)} layoff events, {len(funding)} funding rounds")
-
-    # ── 7. Press Releases ─────────────────────────────────────────────
-    logger.info("[7/7] Collecting press releases...")
-    news_page = news_url or f"https://{domain}/news"
-    press     = scrape_press_releases(company_name, domain, news_page, limit=20)
-    profile["press_releases"] = press
-    logger.success(f"  → {len(press)} press releases")
+    if sink is not None:
+        profile["record_counts"] = {}
+
+    def emit(category: str, rows: list):
+        if sink is None:
+            profile[category] = rows
+        else:
+            sink(category, rows)
+            profile["record_counts"][category] = len(rows)
+
+    # All scrapers are network-bound and independent until scoring, so fire
+    # them together and collect in stage order (wall time ≈ slowest stage).
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        fut_tx    = ex.submit(_fetch_transcripts, ticker, ir_url, company_name)
+        fut_jobs  = ex.submit(_fetch_jobs, careers_url, domain, company_name)
+        fut_stack = ex.submit(detect_tech_stack, domain, company_name)
+        fut_gh    = ex.submit(_fetch_github, github_org, company_name)
+        fut_fin   = ex.submit(scrape_yahoo_finance, ticker, company_name) if ticker else None
+        fut_lay   = ex.submit(scrape_layoff_news, company_name)
+        fut_fund  = ex.submit(scrape_funding_news, company_name)
+        fut_press = ex.submit(_fetch_press, news_url, domain, company_name)
+        logger.info("All 7 stages started — collecting results in order...")
+
+        # ── 1. Earnings Transcripts ───────────────────────────────────
+        logger.info("[1/7] Collecting earnings transcripts...")
+        transcripts = fut_tx.result()
+        emit("transcripts", transcripts)
+        logger.success(f"  → {len(transcripts)} transcripts found")
+
+        # ── 2. Job Postings ───────────────────────────────────────────
+        logger.info("[2/7] Collecting job postings...")
+        jobs = fut_jobs.result()
+        emit("job_postings", jobs)
+        logger.success(f"  → {len(jobs)} job postings found")
+
+        # Lay the jobs out column-wise once; each aggregate is then one pass over a flat list
+        depts      = [j.get("department", "Other") for j in jobs]
+        kw_dicts   = [j.get("keywords", {}) for j in jobs]
+        pivot_cols = [k.get("pivot", ()) for k in kw_dicts]
+        debt_cols  = [k.get("tech_debt", ()) for k in kw_dicts]
+
+        pivot_kws     = _keyword_set(pivot_cols)
+        tech_debt_kws = _keyword_set(debt_cols)
+        profile["hiring_signals"] = {
+            "pivot_keywords":     list(pivot_kws),
+            "tech_debt_keywords": list(tech_debt_kws),
+            "total_jobs":         len(jobs),
+            "departments":        _count_departments(depts),
+        }
+
+        # ── 3. Tech Stack ─────────────────────────────────────────────
+        logger.info("[3/7] Collecting tech stack...")
+        stack = fut_stack.result()
+        profile["tech_stack"] = stack
+        logger.success(f"  → Frameworks: {stack.get('frameworks', [])}")
+
+        # ── 4. GitHub ─────────────────────────────────────────────────
+        logger.info("[4/7] Collecting GitHub data...")
+        gh_data = fut_gh.result()
+        profile["github"] = gh_data
+        logger.success(f"  → {gh_data.get('total_repos', 0)} repos, "
+                       f"{gh_data.get('total_open_issues', 0)} open issues")
+
+        # ── 5. Financials ─────────────────────────────────────────────
+        logger.info("[5/7] Collecting financial data...")
+        financials = fut_fin.result() if fut_fin else []
+        emit("financials", financials)
+        logger.success(f"  → {len(financials)} quarters of data")
+
+        # ── 6. Layoffs & Funding ──────────────────────────────────────
+        logger.info("[6/7] Collecting layoffs & funding...")
+        layoffs  = fut_lay.result()
+        funding  = fut_fund.result()
+        emit("layoffs", layoffs)
+        emit("funding", funding)
+        logger.success(f"  → {len(layoffs)} layoff events, {len(funding)} funding rounds")
+
+        # ── 7. Press Releases ─────────────────────────────────────────
+        logger.info("[7/7] Collecting press releases...")
+        press = fut_press.result()
+        emit("press_releases", press)
+        logger.success(f"  → {len(press)} press releases")
 
     # ── Composite Scores ──────────────────────────────────────────────
     logger.info("Computing composite scores...")
     profile["fiscal_pressure"] = compute_fiscal_pressure(financials, layoffs, funding)
 
-    tech_debt_score = _compute_tech_debt_score(stack, gh_data, jobs)
+    tech_debt_score = _compute_tech_debt_score(stack, gh_data, tech_debt_kws)
     profile["technical_debt"] = tech_debt_score
 
-    pivot_score = _compute_pivot_score(press, jobs, transcripts)
+    pivot_score = _compute_pivot_score(press, pivot_kws, transcripts)
     profile["recent_pivot"] = pivot_score
 
     # Final opportunity score for the LLM evaluator
@@ -151,13 +182,77 @@ def analyze_company(
     logger.info(f"  Opportunity     : {profile['opportunity_score']}/10")
 
     # ── Save to DB ────────────────────────────────────────────────────
-    if save_to_db and db_session:
+    if sink is not None:
+        sink("scores", {k: profile[k] for k in
+                        ("fiscal_pressure", "technical_debt", "recent_pivot", "opportunity_score")})
+    elif save_to_db and db_session:
         _persist_to_db(profile, db_session)
 
     return profile
 
 
-def _compute_tech_debt_score(stack: dict, gh: dict, jobs: list[dict]) -> dict:
+def _url_alive(url: str, timeout: float = 2.0) -> bool | None:
+    """
+    Cheap HEAD probe for guessed URLs, so a dead /careers or /news isn't fully scraped.
+    None when the probe itself failed (timeout, connection error, 5xx, 401/403/429): unknown, so try the page.
+    """
+    try:
+        return _head_alive(url, timeout)
+    except Exception as e:
+        logger.debug(f"HEAD probe failed ({url}): {e}")
+        return None
+
+
+# Refusals that say nothing about whether the page exists (bot filters, rate limits)
+_HEAD_TRANSIENT = frozenset({401, 403, 429})
+_HEAD_GONE      = frozenset({404, 410})
+
+
+@cache.cached(ttl=cache.DAY, keep_empty=True)
+def _head_alive(url: str, timeout: float = 2.0) -> bool:
+    """Only definitive HTTP answers are returned (and cached); failures raise."""
+    r = get_session().head(url, allow_redirects=True, timeout=timeout)
+    if r.status_code >= 500 or r.status_code in _HEAD_TRANSIENT:
+        r.raise_for_status()
+    # Only a 404/410 means dead; e.g. a 405 refusing HEAD still means the page exists
+    return r.status_code not in _HEAD_GONE
+
+
+def _fetch_jobs(careers_url: str | None, domain: str, company_name: str) -> list[dict]:
+    if careers_url:
+        return scrape_careers_page(careers_url, company_name, 25)
+    guessed = f"https://{domain}/careers"
+    # Dead guess: still try the ATS boards, just skip the page itself
+    return scrape_careers_page(guessed, company_name, 25, direct=_url_alive(guessed) is not False)
+
+
+def _fetch_press(news_url: str | None, domain: str, company_name: str) -> list[dict]:
+    news_page = news_url or f"https://{domain}/news"
+    if not news_url and _url_alive(news_page) is False:
+        news_page = None   # RSS and Google News still run
+    return scrape_press_releases(company_name, domain, news_page, 20)
+
+
+def _fetch_transcripts(ticker: str | None, ir_url: str | None, company_name: str) -> list[dict]:
+    """EDGAR first; fall back to the IR page only if EDGAR came back thin."""
+    transcripts = []
+    if ticker:
+        transcripts = search_edgar_transcripts(ticker, limit=4)
+    if ir_url and len(transcripts) < 2:
+        transcripts += scrape_ir_page_transcripts(ir_url, company_name)
+    return transcripts
+
+
+def _fetch_github(github_org: str | None, company_name: str) -> dict:
+    """Resolve the org slug if needed, then scrape it."""
+    if not github_org:
+        github_org = find_github_org(company_name)
+    if github_org:
+        return scrape_github_org(github_org, company_name)
+    return {}
+
+
+def _compute_tech_debt_score(stack: dict, gh: dict, debt_kws: set) -> dict:
     score = 0
     signals = []
 
@@ -174,12 +269,9 @@ def _compute_tech_debt_score(stack: dict, gh: dict, jobs: list[dict]) -> dict:
         signals.append(f"GitHub debt score: {gh_score}/10")
 
     # Hiring signals
-    debt_kws = []
-    for j in jobs:
-        debt_kws += j.get("keywords", {}).get("tech_debt", [])
     if debt_kws:
-        score += min(4, len(set(debt_kws)))
-        signals.append(f"Job posting signals: {list(set(debt_kws))[:5]}")
+        score += min(4, len(debt_kws))
+        signals.append(f"Job posting signals: {list(debt_kws)[:5]}")
 
     score = min(10, score)
     return {
@@ -189,34 +281,33 @@ def _compute_tech_debt_score(stack: dict, gh: dict, jobs: list[dict]) -> dict:
     }
 
 
-def _compute_pivot_score(press: list, jobs: list, transcripts: list) -> dict:
+def _compute_pivot_score(press: list, pivot_kws: set, transcripts: list) -> dict:
     score = 0
     signals = []
 
     # Press release pivot signals
-    all_pr_signals = []
-    for pr in press:
-        all_pr_signals += pr.get("pivot_signals", [])
+    all_pr_signals = set(chain.from_iterable(pr.get("pivot_signals", ()) for pr in press))
     if all_pr_signals:
-        score += min(4, len(set(all_pr_signals)))
-        signals.append(f"PR signals: {list(set(all_pr_signals))[:5]}")
+        score += min(4, len(all_pr_signals))
+        signals.append(f"PR signals: {list(all_pr_signals)[:5]}")
 
     # Job posting pivot signals
-    pivot_kws = []
-    for j in jobs:
-        pivot_kws += j.get("keywords", {}).get("pivot", [])
     if pivot_kws:
-        score += min(3, len(set(pivot_kws)))
-        signals.append(f"Hiring pivot: {list(set(pivot_kws))[:5]}")
+        score += min(3, len(pivot_kws))
+        signals.append(f"Hiring pivot: {list(pivot_kws)[:5]}")
 
 
     # Transcript keyword count (basic)
     pivot_terms_in_transcripts = 0
     for t in transcripts:
-        text = t.get("raw_text", "").lower()
-        for term in ["ai-first", "strategic", "transformation", "pivot", "expand", "realign"]:
-            if term in text:
-                pivot_terms_in_transcripts += 1
+        # Single regex pass; each distinct term counts once per transcript,
+        # so the scan stops as soon as every term has been seen
+        found = set()
+        for m in _TRANSCRIPT_PIVOT_RE.finditer(t.get("raw_text", "")):
+            found.add(m.group().lower())
+            if len(found) == len(TRANSCRIPT_PIVOT_TERMS):
+                break
+        pivot_terms_in_transcripts += len(found)
     if pivot_terms_in_transcripts:
         score += min(3, pivot_terms_in_transcripts // 2)
         signals.append(f"Transcript pivot mentions: {pivot_terms_in_transcripts}")
@@ -242,12 +333,13 @@ def _compute_opportunity_score(fiscal: float, debt: float, pivot: float,
     return round(score, 2)
 
 
-def _count_departments(jobs: list) -> dict:
-    counts = {}
-    for j in jobs:
-        dept = j.get("department", "Other")
-        counts[dept] = counts.get(dept, 0) + 1
-    return dict(sorted(counts.items(), key=lambda x: x[1], reverse=True))
+def _keyword_set(keyword_cols: list) -> set:
+    """Distinct keywords from one per-job keyword column."""
+    return set(chain.from_iterable(keyword_cols))
+
+
+def _count_departments(depts: list[str]) -> dict:
+    return dict(Counter(depts).most_common())
 
 
 def _score_to_label(score: int) -> str:
@@ -262,76 +354,14 @@ def _persist_to_db(profile: dict, session):
     """Save all scraped data to the database."""
     company_name = profile["company_name"]
     try:
-        # Upsert company
-        company = session.query(Company).filter_by(name=company_name).first()
-        if not company:
-            company = Company(name=company_name, domain=profile["domain"])
-            session.add(company)
-
-        # Transcripts
-        for t in profile.get("transcripts", []):
-            session.add(EarningsTranscript(
-                company_name=company_name,
-                quarter=t.get("quarter", ""),
-                raw_text=t.get("raw_text", ""),
-                source_url=t.get("source_url", ""),
-            ))
-
-        # Jobs
-        for j in profile.get("job_postings", []):
-            session.add(JobPosting(
-                company_name=company_name,
-                role_title=j.get("role_title", ""),
-                department=j.get("department", ""),
-                description=j.get("description", ""),
-                keywords=j.get("keywords", {}),
-                posted_date=j.get("posted_date", ""),
-                source=j.get("source", ""),
-            ))
-
-        # Financials
-        for f in profile.get("financials", []):
-            session.add(FinancialData(
-                company_name=company_name,
-                ticker=f.get("ticker", ""),
-                quarter=f.get("quarter", ""),
-                revenue=f.get("revenue"),
-                operating_margin=f.get("operating_margin"),
-                gross_margin=f.get("gross_margin"),
-                net_income=f.get("net_income"),
-                source=f.get("source", ""),
-            ))
-
-        # Layoffs
-        for l in profile.get("layoffs", []):
-            session.add(LayoffEvent(
-                company_name=company_name,
-                date=l.get("date", ""),
-                headcount=l.get("headcount"),
-                percentage=l.get("percentage"),
-                source_url=l.get("source_url", ""),
-            ))
-
-        # Funding
-        for f in profile.get("funding", []):
-            session.add(FundingRound(
-                company_name=company_name,
-                round_type=f.get("round_type", ""),
-                amount_usd=f.get("amount_usd"),
-                date=f.get("date", ""),
-                investors=f.get("investors", []),
-                source_url=f.get("source_url", ""),
-            ))
-
-        # Press releases
-        for pr in profile.get("press_releases", []):
-            session.add(PressRelease(
-                company_name=company_name,
-                title=pr.get("title", ""),
-                content=pr.get("content", ""),
-                published_date=pr.get("published_date", ""),
-                source_url=pr.get("source_url", ""),
-            ))
+        _upsert_company(session, company_name, profile["domain"])
+
+        # Rows are grouped by table, so each category goes out as one batched INSERT
+        rows = []
+        for category in DB_CATEGORIES:
+            rows += _db_rows(category, profile.get(category, []), company_name)
+        with session.no_autoflush:
+            session.bulk_save_objects(rows)
 
         session.commit()
         logger.success(f"[{company_name}] Data saved to DB")
@@ -341,6 +371,131 @@ def _persist_to_db(profile: dict, session):
         logger.error(f"DB save failed: {e}")
 
 
+DB_CATEGORIES = ("transcripts", "job_postings", "financials", "layoffs", "funding", "press_releases")
+
+
+def _upsert_company(session, company_name: str, domain: str):
+    company = session.query(Company).filter_by(name=company_name).first()
+    if not company:
+        session.add(Company(name=company_name, domain=domain))
+
+
+def _db_rows(category: str, items: list, company_name: str) -> list:
+    """ORM rows for one profile category."""
+    if category == "transcripts":
+        return [EarningsTranscript(
+            company_name=company_name,
+            quarter=t.get("quarter", ""),
+            raw_text=t.get("raw_text", ""),
+            source_url=t.get("source_url", ""),
+        ) for t in items]
+
+    if category == "job_postings":
+        return [JobPosting(
+            company_name=company_name,
+            role_title=j.get("role_title", ""),
+            department=j.get("department", ""),
+            description=j.get("description", ""),
+            keywords=j.get("keywords", {}),
+            posted_date=j.get("posted_date", ""),
+            source=j.get("source", ""),
+        ) for j in items]
+
+    if category == "financials":
+        return [FinancialData(
+            company_name=company_name,
+            ticker=f.get("ticker", ""),
+            quarter=f.get("quarter", ""),
+            revenue=f.get("revenue"),
+            operating_margin=f.get("operating_margin"),
+            gross_margin=f.get("gross_margin"),
+            net_income=f.get("net_income"),
+            source=f.get("source", ""),
+        ) for f in items]
+
+    if category == "layoffs":
+        return [LayoffEvent(
+            company_name=company_name,
+            date=l.get("date", ""),
+            headcount=l.get("headcount"),
+            percentage=l.get("percentage"),
+            source_url=l.get("source_url", ""),
+        ) for l in items]
+
+    if category == "funding":
+        return [FundingRound(
+            company_name=company_name,
+            round_type=f.get("round_type", ""),
+            amount_usd=f.get("amount_usd"),
+            date=f.get("date", ""),
+            investors=f.get("investors", []),
+            source_url=f.get("source_url", ""),
+        ) for f in items]
+
+    if category == "press_releases":
+        return [PressRelease(
+            company_name=company_name,
+            title=pr.get("title", ""),
+            content=pr.get("content", ""),
+            published_date=pr.get("published_date", ""),
+            source_url=pr.get("source_url", ""),
+        ) for pr in items]
+
+    return []
+
+
+class ProfileSink:
+    """
+    Streams each category out as soon as its stage finishes: rows go to the DB
+    (one batched INSERT per category) and to a JSON-lines file, so analyze_company
+    doesn't have to hold every scraped record until the end.
+    """
+
+    def __init__(self, company_name: str, domain: str, session=None, out=None):
+        self.company_name = company_name
+        self.session      = session
+        self.out          = out
+        if session is not None:
+            try:
+                _upsert_company(session, company_name, domain)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"DB save failed: {e}")
+
+    def __call__(self, category: str, rows):
+        if self.out is not None:
+            # One write per record, so concurrent demo workers appending to the same file don't interleave
+            self.out.write(_dumps_line({"company_name": self.company_name,
+                                        "category": category, "rows": rows}))
+            self.out.flush()
+        if self.session is not None and category in DB_CATEGORIES and rows:
+            try:
+                with self.session.no_autoflush:
+                    self.session.bulk_save_objects(_db_rows(category, rows, self.company_name))
+                self.session.commit()
+            except Exception as e:
+                self.session.rollback()
+                logger.error(f"DB save failed ({category}): {e}")
+
+
+def _dumps_line(record) -> str:
+    if HAS_ORJSON:
+        return orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE).decode()
+    return json.dumps(record, default=str) + "\n"
+
+
+def _write_json(path: str, data):
+    """Dump profiles with orjson (C, bytes straight to disk) when available."""
+    if HAS_ORJSON:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, default=str,
+                                 option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2, default=str)
+
+
 # ── Demo Companies (Hackathon Pre-load) ──────────────────────────────────────
 DEMO_COMPANIES = [
     {
@@ -381,6 +536,18 @@ DEMO_COMPANIES = [
 ]
 
 
+def _init_demo_worker(use_cache: bool):
+    cache.set_enabled(use_cache)
+
+
+def _analyze_one(company: dict) -> dict:
+    """
+    Demo worker: scrapes only and hands the profile back. The parent saves it,
+    so writes stay serialized (SQLite allows a single writer at a time).
+    """
+    return analyze_company(**company, save_to_db=False)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="DataVex B2B Intelligence Scraper")
     parser.add_argument("--company",     help="Company name")
@@ -392,23 +559,29 @@ if __name__ == "__main__":
     parser.add_argument("--news",        help="News page URL (optional)")
     parser.add_argument("--demo",        action="store_true", help="Run all demo companies")
     parser.add_argument("--output",      default="profile.json", help="Output JSON file")
+    parser.add_argument("--no-cache",    action="store_true", help="Bypass the on-disk scraper cache")
     args = parser.parse_args()
-
-    # Init DB
-    SessionFactory = init_db()
-    session = SessionFactory()
+    cache.set_enabled(not args.no_cache)
 
     if args.demo:
         logger.info("Running demo mode — analyzing 5 pre-selected companies")
-        profiles = []
-        for company in DEMO_COMPANIES:
-            profile = analyze_company(**company, db_session=session, save_to_db=True)
-            profiles.append(profile)
-        with open("demo_profiles.json", "w") as f:
-            json.dump(profiles, f, indent=2, default=str)
+        # Companies are independent — one process each, so parsing isn't GIL-bound
+        with ProcessPoolExecutor(
+            max_workers=min(len(DEMO_COMPANIES), os.cpu_count() or 1),
+            initializer=_init_demo_worker, initargs=(not args.no_cache,),
+        ) as pp:
+            profiles = list(pp.map(_analyze_one, DEMO_COMPANIES))
+        session = init_db()()
+        try:
+            for profile in profiles:
+                _persist_to_db(profile, session)
+        finally:
+            session.close()
+        _write_json("demo_profiles.json", profiles)
         logger.success("Demo complete! Profiles saved to demo_profiles.json")
 
     elif args.company and args.domain:
+        session = init_db()()
         profile = analyze_company(
             company_name=args.company,
             domain=args.domain,
@@ -420,8 +593,7 @@ if __name__ == "__main__":
             db_session=session,
             save_to_db=True,
         )
-        with open(args.output, "w") as f:
-            json.dump(profile, f, indent=2, default=str)
+        _write_json(args.output, profile)
         logger.success(f"Profile saved to {args.output}")
 
     else:
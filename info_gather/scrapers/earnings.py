@@ -6,16 +6,39 @@ Sources:
   3. Yahoo Finance earnings summary
 """
 import re
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+import lxml.html
 from loguru import logger
-from utils.http import safe_get, get_session, extract_text_from_pdf_bytes
+from utils.http import (
+    safe_get, safe_stream, get_http2_client, extract_text_from_pdf_bytes,
+    async_safe_get, async_safe_get_capped, get_async_client, HostLimiter,
+    extract_text_from_html_stream, extract_text_from_html_bytes, STREAM_CHUNK_BYTES, MAX_PDF_BYTES, MAX_HTML_BYTES,
+)
+from utils.cache import cached, DAY
 
 
 EDGAR_SEARCH = "https://efts.sec.gov/LATEST/search-index?q=%22earnings+call%22&dateRange=custom&startdt={start}&enddt={end}&entity={ticker}&forms=8-K"
 EDGAR_FILING  = "https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK={ticker}&type=8-K&dateb=&owner=include&count=10&search_text="
 
+_IR_KEYWORDS = re.compile(
+    r"(earnings|transcript|quarterly|annual.report|investor.presentation|10-[kq])", re.I
+)
+_QUARTER_RE  = re.compile(r"(Q[1-4]\s*20\d{2}|20\d{2}\s*Q[1-4]|FY\s*20\d{2})", re.I)
+_YEAR_RE     = re.compile(r"(20\d{2})")
 
+EDGAR_WORKERS     = 4    # filings in flight at once
+EDGAR_CANDIDATES  = 2    # filings listed per transcript wanted — many 8-Ks have no usable document
+
+EDGAR_HEADERS     = {"User-Agent": "DataVex-Research"}
+
+IR_MAX_RESULTS    = 6
+IR_MAX_CANDIDATES = 20   # keyword-matching links considered per IR page
+IR_CONCURRENCY    = 4    # documents in flight at once, as for EDGAR
+
+
+@cached(ttl=DAY)
 def search_edgar_transcripts(ticker: str, limit: int = 4) -> list[dict]:
     """
     Fetch 8-K filings from SEC EDGAR for a ticker.
@@ -24,33 +47,56 @@ def search_edgar_transcripts(ticker: str, limit: int = 4) -> list[dict]:
     """
     results = []
     url = EDGAR_FILING.format(ticker=ticker.upper())
-    session = get_session()
+    # One keep-alive client for the list, index and document fetches
+    session = get_http2_client(EDGAR_HEADERS)
     try:
         resp = safe_get(url, session)
-        soup = BeautifulSoup(resp.text, "lxml")
+        doc = lxml.html.fromstring(resp.content)
 
         # Find filing links
         filing_links = []
-        for row in soup.select("table.tableFile2 tr"):
-            cells = row.find_all("td")
-            if len(cells) >= 2 and "8-K" in cells[0].get_text():
-                link_tag = cells[1].find("a")
-                if link_tag:
-                    filing_links.append("https://www.sec.gov" + link_tag["href"])
-            if len(filing_links) >= limit:
+        for row in doc.xpath("//table[contains(concat(' ', @class, ' '), ' tableFile2 ')]//tr"):
+            cells = row.xpath("./td")
+            if len(cells) >= 2 and "8-K" in cells[0].text_content():
+                hrefs = cells[1].xpath(".//a/@href")
+                if hrefs:
+                    filing_links.append("https://www.sec.gov" + hrefs[0])
+            if len(filing_links) >= limit * EDGAR_CANDIDATES:
                 break
 
-        for filing_url in filing_links:
-            text, source = _extract_text_from_filing_page(filing_url, session)
-            if text:
-                results.append({
-                    "quarter": _guess_quarter_from_text(text),
-                    "raw_text": text,
-                    "source_url": source
-                })
+        # Handle filings in completion order, but only stop once every filing up
+        # to the newest `limit` hits has resolved, so a slow newer filing is never
+        # dropped for a faster older one. Filings still queued are then cancelled;
+        # running ones are abandoned and cut off when the client closes below.
+        found, done, prefix, prefix_hits = {}, set(), 0, 0
+        ex = ThreadPoolExecutor(max_workers=EDGAR_WORKERS)
+        try:
+            futures = {ex.submit(_extract_text_from_filing_page, u, session): i
+                       for i, u in enumerate(filing_links)}
+            for fut in as_completed(futures):
+                text, source = fut.result()
+                i = futures[fut]
+                done.add(i)
+                if text:
+                    found[i] = {
+                        "quarter": _guess_quarter_from_text(text),
+                        "raw_text": text,
+                        "source_url": source
+                    }
+                while prefix in done:
+                    prefix_hits += prefix in found
+                    prefix += 1
+                if prefix_hits >= limit:
+                    break
+        finally:
+            ex.shutdown(wait=False, cancel_futures=True)
+
+        results = [found[i] for i in sorted(found)][:limit]
 
     except Exception as e:
         logger.warning(f"EDGAR scrape failed for {ticker}: {e}")
+    finally:
+        session.close()
 
     return results
 
@@ -59,24 +105,28 @@ def _extract_text_from_filing_page(filing_index_url: str, session) -> tuple[str,
     """Given an 8-K filing index page, find and return the main document text."""
     try:
         resp = safe_get(filing_index_url, session)
-        soup = BeautifulSoup(resp.text, "lxml")
+        doc = lxml.html.fromstring(resp.content)
         # Filing index has a table listing documents
-        for link in soup.select("table a"):
+        for link in doc.xpath("//table//a"):
             href = link.get("href", "")
-            name = link.get_text(strip=True).lower()
+            name = link.text_content().strip().lower()
             # Look for the primary document (htm or txt)
             if href.endswith((".htm", ".html", ".txt")) and "8-k" not in name:
                 doc_url = urljoin("https://www.sec.gov", href)
-                doc_resp = safe_get(doc_url, session)
-                doc_soup = BeautifulSoup(doc_resp.text, "lxml")
-                text = doc_soup.get_text(separator=" ", strip=True)
+                # Stream the document and stop parsing once 50k chars are in hand
+                doc_resp = safe_stream(doc_url, session)
+                try:
+                    text = extract_text_from_html_stream(doc_resp.iter_bytes(STREAM_CHUNK_BYTES))
+                finally:
+                    doc_resp.close()
                 if len(text) > 500:
-                    return text[:50000], doc_url   # cap at 50k chars
+                    return text, doc_url
     except Exception as e:
         logger.debug(f"Filing extraction failed: {e}")
     return "", filing_index_url
 
 
+@cached(ttl=DAY)
 def scrape_ir_page_transcripts(ir_url: str, company_name: str) -> list[dict]:
     """
     Crawl a company's Investor Relations page looking for:
@@ -84,65 +134,92 @@ def scrape_ir_page_transcripts(ir_url: str, company_name: str) -> list[dict]:
     - PDF presentations
     Returns list of dicts.
     """
-    results = []
-    session = get_session()
-    try:
-        resp = safe_get(ir_url, session)
-        soup = BeautifulSoup(resp.text, "lxml")
-
-        keyword_patterns = re.compile(
-            r"(earnings|transcript|quarterly|annual.report|investor.presentation|10-[kq])",
-            re.I
-        )
-        for link in soup.find_all("a", href=True):
-            text = link.get_text(strip=True)
-            href = link["href"]
-            full_url = urljoin(ir_url, href)
-
-            if not keyword_patterns.search(text + href):
-                continue
-
-            if href.lower().endswith(".pdf"):
-                try:
-                    pdf_resp = safe_get(full_url, session)
-                    raw_text = extract_text_from_pdf_bytes(pdf_resp.content)
-                    results.append({
-                        "quarter": _guess_quarter_from_text(raw_text),
-                        "raw_text": raw_text[:50000],
-                        "source_url": full_url,
-                    })
-                    logger.info(f"[{company_name}] PDF transcript pulled: {full_url}")
-                except Exception as e:
-                    logger.debug(f"PDF failed: {e}")
-
-            elif href.lower().endswith((".htm", ".html")):
-                try:
-                    page_resp = safe_get(full_url, session)
-                    page_soup = BeautifulSoup(page_resp.text, "lxml")
-                    raw_text = page_soup.get_text(separator=" ", strip=True)
-                    if len(raw_text) > 1000:
-                        results.append({
-                            "quarter": _guess_quarter_from_text(raw_text),
-                            "raw_text": raw_text[:50000],
-                            "source_url": full_url,
-                        })
-                        logger.info(f"[{company_name}] HTML transcript pulled: {full_url}")
-                except Exception as e:
-                    logger.debug(f"HTML failed: {e}")
-
-            if len(results) >= 6:
-                break
+    return asyncio.run(_ascrape_ir_page_transcripts(ir_url, company_name))
 
+
+async def _ascrape_ir_page_transcripts(ir_url: str, company_name: str) -> list[dict]:
+    """
+    Parse the IR page once, then fetch candidate links concurrently. Once
+    IR_MAX_RESULTS transcripts are in, downloads still queued or running are
+    cancelled. Output keeps page order.
+    """
+    try:
+        async with get_async_client() as client:
+            resp = await async_safe_get(ir_url, client)
+            doc = lxml.html.fromstring(resp.content)
+            candidates = []
+            for link in doc.xpath("//a[@href]"):
+                text = link.text_content().strip()
+                href = link.get("href")
+                if not _IR_KEYWORDS.search(text + href):
+                    continue
+                if href.lower().endswith((".pdf", ".htm", ".html")):
+                    candidates.append(urljoin(ir_url, href))
+                if len(candidates) >= IR_MAX_CANDIDATES:
+                    break
+
+            # Overall cap plus a per-host cap, so one IR/CDN host isn't swamped
+            sem   = asyncio.BoundedSemaphore(IR_CONCURRENCY)
+            hosts = HostLimiter()
+            tasks = {asyncio.create_task(_afetch_ir_document(client, sem, hosts(u), u, company_name)): i
+                     for i, u in enumerate(candidates)}
+            found, pending = {}, set(tasks)
+            try:
+                while pending and len(found) < IR_MAX_RESULTS:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception() is None and task.result():
+                            found[tasks[task]] = task.result()
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
     except Exception as e:
         logger.warning(f"IR page scrape failed ({ir_url}): {e}")
-
-    return results
+        return []
+
+    return [found[i] for i in sorted(found)][:IR_MAX_RESULTS]
+
+
+async def _afetch_ir_document(client, sem, host_sem, full_url: str, company_name: str) -> dict | None:
+    async with sem, host_sem:
+        if full_url.lower().endswith(".pdf"):
+            try:
+                pdf_bytes, truncated = await async_safe_get_capped(full_url, client, MAX_PDF_BYTES)
+                if truncated:
+                    logger.debug(f"PDF over {MAX_PDF_BYTES} bytes, skipped: {full_url}")
+                    return None
+                # PDF text extraction is CPU-bound — keep it off the event loop
+                raw_text = await asyncio.to_thread(extract_text_from_pdf_bytes, pdf_bytes)
+                logger.info(f"[{company_name}] PDF transcript pulled: {full_url}")
+                return {
+                    "quarter": _guess_quarter_from_text(raw_text),
+                    "raw_text": raw_text[:50000],
+                    "source_url": full_url,
+                }
+            except Exception as e:
+                logger.debug(f"PDF failed: {e}")
+                return None
+
+        try:
+            page_bytes, _ = await async_safe_get_capped(full_url, client, MAX_HTML_BYTES)
+            raw_text = extract_text_from_html_bytes(page_bytes)
+            if len(raw_text) > 1000:
+                logger.info(f"[{company_name}] HTML transcript pulled: {full_url}")
+                return {
+                    "quarter": _guess_quarter_from_text(raw_text),
+                    "raw_text": raw_text,
+                    "source_url": full_url,
+                }
+        except Exception as e:
+            logger.debug(f"HTML failed: {e}")
+        return None
 
 
 def _guess_quarter_from_text(text: str) -> str:
     """Heuristically extract quarter/year string from transcript text."""
-    match = re.search(r"(Q[1-4]\s*20\d{2}|20\d{2}\s*Q[1-4]|FY\s*20\d{2})", text, re.I)
+    match = _QUARTER_RE.search(text)
     if match:
         return match.group(0).strip()
-    year_match = re.search(r"(20\d{2})", text)
+    year_match = _YEAR_RE.search(text)
     return year_match.group(0) if year_match else "Unknown"
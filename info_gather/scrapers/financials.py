@@ -8,45 +8,68 @@ Sources:
 """
 import re
 import json
-import feedparser
+from datetime import datetime
 from loguru import logger
-from utils.http import safe_get, get_session
+from utils.http import safe_stream, get_http2_client, STREAM_CHUNK_BYTES
+from utils.feeds import fetch_news_feeds
+from utils.cache import cached, HOUR, DAY
 
 YAHOO_FINANCE_SUMMARY = "https://finance.yahoo.com/quote/{ticker}"
 YAHOO_FINANCE_INCOME  = "https://finance.yahoo.com/quote/{ticker}/financials"
 LAYOFFS_FYI           = "https://layoffs.fyi"
-GOOGLE_NEWS_RSS       = "https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
+
+# Byte patterns that stop right before the embedded JSON value
+_YAHOO_ROOT_RE    = re.compile(rb'root\.App\.main\s*=\s*(?=\{)')
+_YAHOO_Q_RE       = re.compile(rb'"QuarterlyIncomeStatementHistory":\{"incomeStatementHistory":(?=\[)')
+_JSON_DECODER     = json.JSONDecoder()
+_YAHOO_TABLE_RE   = re.compile(rb'([\d,]+(?:\.\d+)?[BMK]?)\s*(TTM|Q[1-4]\s*20\d{2})')
+# News-entry patterns run on pre-lowercased text, so none of them need re.I
+_LAYOFF_TERMS_RE  = re.compile(r"(layoff|laid.off|job.cut|headcount|redundanc|retrench|workforce.reduc)")
+_HEADCOUNT_RE     = re.compile(r"(\d[\d,]+)\s*(employee|worker|staff|job)")
+_PCT_RE           = re.compile(r"(\d+)\s*%")
+_FUNDING_TERMS    = tuple(f"series {c}" for c in "abcdef") + (
+    "seed round", "raises", "raised", "funding", "invest", "valuation", "pre-seed",
+)
+_ROUND_RE         = re.compile(r"(seed|series [a-f]|pre-seed|growth|late.stage|ipo|spac)")
+_AMOUNT_RE        = re.compile(r"\$\s*([\d.]+)\s*(million|billion|m|b)\b")
+_YEAR_RE          = re.compile(r"20\d{2}")
 
 
 # ─── Revenue / Margin Scraping ───────────────────────────────────────────────
 
+@cached(ttl=DAY)
 def scrape_yahoo_finance(ticker: str, company_name: str) -> list[dict]:
     """
     Scrape quarterly financial data from Yahoo Finance.
     Returns list of dicts per available quarter.
     """
     quarters = []
-    session  = get_session()
     url = YAHOO_FINANCE_INCOME.format(ticker=ticker.upper())
 
     try:
-        resp = safe_get(url, session, timeout=20)
-
-        # Yahoo Finance embeds data in a JSON blob in the page
-        match = re.search(r'root\.App\.main\s*=\s*(\{.+?\});\n', resp.text, re.S)
-        if not match:
-            match = re.search(r'"QuarterlyIncomeStatementHistory":\{"incomeStatementHistory":(\[.+?\])', resp.text)
-
-        if match:
+        with get_http2_client() as client:
+            resp = safe_stream(url, client)
             try:
-                data = json.loads(match.group(1))
-                quarters = _parse_yahoo_income(data, company_name, ticker)
-            except json.JSONDecodeError:
-                pass
+                # Yahoo Finance embeds data in a JSON blob in the page —
+                # stop reading once its <script> has closed
+                chunks = resp.iter_bytes(STREAM_CHUNK_BYTES)
+                body, data = _read_until_yahoo_blob(chunks)
+                if data is not None:
+                    quarters = _parse_yahoo_income(data, company_name, ticker)
+
+                if not quarters:
+                    # The fallbacks need the whole page
+                    body += b"".join(chunks)
+                    if data is None:
+                        data = _json_after(body, _YAHOO_Q_RE)
+                        if data is not None:
+                            quarters = _parse_yahoo_income(data, company_name, ticker)
+            finally:
+                resp.close()
 
         # Fallback: scrape visible table numbers
         if not quarters:
-            quarters = _scrape_yahoo_table(resp.text, company_name, ticker)
+            quarters = _scrape_yahoo_table(body, company_name, ticker)
 
         logger.info(f"[{company_name}] Yahoo Finance: {len(quarters)} quarters")
 
@@ -56,6 +79,47 @@ def scrape_yahoo_finance(ticker: str, company_name: str) -> list[dict]:
     return quarters
 
 
+def _read_until_yahoo_blob(chunks) -> tuple[bytearray, object]:
+    """
+    Buffer the page until the root.App.main blob and its closing </script> have
+    arrived, then decode it. The rest of the page (often half of it) is never read.
+    Returns (bytes read so far, decoded blob or None if there wasn't one).
+    """
+    body  = bytearray()
+    start = None
+    for chunk in chunks:
+        seen  = len(body)
+        body += chunk
+        if start is None:
+            # Re-check a little of the previous chunk in case the marker straddles the boundary
+            match = _YAHOO_ROOT_RE.search(body, max(0, seen - 64))
+            if not match:
+                continue
+            start = match.end()
+        end = body.find(b"</script>", max(start, seen - 8))
+        if end != -1:
+            return body, _json_at(body[start:end])
+    return body, (_json_at(body[start:]) if start is not None else None)
+
+
+def _json_after(body: bytes, marker: re.Pattern):
+    """
+    Decode the JSON value that starts where marker matches in the raw bytes.
+    raw_decode stops at the value's closing brace, so the rest of the page isn't scanned.
+    """
+    match = marker.search(body)
+    return _json_at(body[match.end():]) if match else None
+
+
+def _json_at(data: bytes):
+    """Decode the JSON value at the start of data, ignoring whatever follows it."""
+    try:
+        value, _ = _JSON_DECODER.raw_decode(data.decode("utf-8", "replace"))
+        return value
+    except ValueError:
+        return None
+
+
 def _parse_yahoo_income(data: dict, company_name: str, ticker: str) -> list[dict]:
     """Try to extract quarterly income data from Yahoo Finance JSON blob."""
     results = []
@@ -93,9 +157,12 @@ def _parse_yahoo_income(data: dict, company_name: str, ticker: str) -> list[dict
     return results
 
 
-def _scrape_yahoo_table(html: str, company_name: str, ticker: str) -> list[dict]:
-    """Regex fallback to pull raw numbers from Yahoo Finance table."""
-    numbers = re.findall(r'([\d,]+(?:\.\d+)?[BMK]?)\s*(?:TTM|Q[1-4]\s*20\d{2})', html)
+def _scrape_yahoo_table(body: bytes, company_name: str, ticker: str) -> list[dict]:
+    """
+    Regex fallback to pull raw (value, period) pairs from the Yahoo Finance table.
+    Runs on the raw bytes, so the page is never decoded — only matches would be.
+    """
+    numbers = _YAHOO_TABLE_RE.findall(body)
     if numbers:
         logger.debug(f"Fallback table scrape found {len(numbers)} values for {ticker}")
     return []   # stub — in full version parse table rows
@@ -103,37 +170,29 @@ def _scrape_yahoo_table(html: str, company_name: str, ticker: str) -> list[dict]
 
 # ─── Layoff Events ───────────────────────────────────────────────────────────
 
+@cached(ttl=6 * HOUR)
 def scrape_layoff_news(company_name: str) -> list[dict]:
     """
     Search Google News RSS for layoff events for a company.
     Also checks layoffs.fyi via Google News.
     """
     layoffs = []
+    # One OR-query instead of one feed per phrasing — same terms, a quarter of the RTTs
     queries = [
-        f"{company_name} layoffs 2024",
-        f"{company_name} layoffs 2025",
-        f"{company_name} headcount reduction",
-        f"{company_name} job cuts",
+        f'{company_name} (layoffs OR "job cuts" OR "headcount reduction")',
     ]
 
-    for query in queries:
-        url = GOOGLE_NEWS_RSS.format(query=query.replace(" ", "+"))
-        try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:5]:
-                layoff = _parse_layoff_entry(entry, company_name)
-                if layoff:
-                    layoffs.append(layoff)
-        except Exception as e:
-            logger.debug(f"News RSS failed for '{query}': {e}")
-
-    # Deduplicate by title
-    seen = set()
-    unique = []
-    for l in layoffs:
-        if l["source_url"] not in seen:
-            seen.add(l["source_url"])
-            unique.append(l)
+    for query, entries in zip(queries, fetch_news_feeds(queries, 20)):
+        if isinstance(entries, Exception):
+            logger.debug(f"News RSS failed for '{query}': {entries}")
+            continue
+        for entry in entries:
+            layoff = _parse_layoff_entry(entry, company_name)
+            if layoff:
+                layoffs.append(layoff)
+
+    # Deduplicate by URL — the same article parses identically whichever query found it
+    unique = list({l["source_url"]: l for l in layoffs}.values())
 
     logger.info(f"[{company_name}] Layoff signals: {len(unique)} found")
     return unique
@@ -147,15 +206,15 @@ def _parse_layoff_entry(entry, company_name: str) -> dict | None:
     summary  = entry.get("summary", "")
 
     # Verify it's actually about layoffs
-    layoff_terms = r"(layoff|laid.off|job.cut|headcount|redundanc|retrench|workforce.reduc)"
-    if not re.search(layoff_terms, title + summary, re.I):
+    text = (title + summary).lower()
+    if not _LAYOFF_TERMS_RE.search(text):
         return None
 
     # Try to extract headcount from title
-    headcount_match = re.search(r"(\d[\d,]+)\s*(employee|worker|staff|job)", title + summary, re.I)
+    headcount_match = _HEADCOUNT_RE.search(text)
     headcount = int(headcount_match.group(1).replace(",", "")) if headcount_match else None
 
-    pct_match = re.search(r"(\d+)\s*%", title + summary)
+    pct_match = _PCT_RE.search(text)
     percentage = float(pct_match.group(1)) if pct_match else None
 
     return {
@@ -170,6 +229,7 @@ def _parse_layoff_entry(entry, company_name: str) -> dict | None:
 
 # ─── Funding Rounds ──────────────────────────────────────────────────────────
 
+@cached(ttl=6 * HOUR)
 def scrape_funding_news(company_name: str) -> list[dict]:
     """
     Search Google News RSS for funding round announcements.
@@ -177,28 +237,20 @@ def scrape_funding_news(company_name: str) -> list[dict]:
     """
     rounds = []
     queries = [
-        f"{company_name} funding round 2024",
-        f"{company_name} series funding raised",
-        f"{company_name} raises million investment",
+        f'{company_name} ("funding round" OR "series funding" OR raises OR raised OR investment)',
     ]
 
-    for query in queries:
-        url = GOOGLE_NEWS_RSS.format(query=query.replace(" ", "+"))
-        try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:4]:
-                rd = _parse_funding_entry(entry, company_name)
-                if rd:
-                    rounds.append(rd)
-        except Exception as e:
-            logger.debug(f"Funding RSS failed: {e}")
-
-    # Deduplicate
-    seen, unique = set(), []
-    for r in rounds:
-        if r["source_url"] not in seen:
-            seen.add(r["source_url"])
-            unique.append(r)
+    for entries in fetch_news_feeds(queries, 12):
+        if isinstance(entries, Exception):
+            logger.debug(f"Funding RSS failed: {entries}")
+            continue
+        for entry in entries:
+            rd = _parse_funding_entry(entry, company_name)
+            if rd:
+                rounds.append(rd)
+
+    # Deduplicate by URL
+    unique = list({r["source_url"]: r for r in rounds}.values())
 
     logger.info(f"[{company_name}] Funding signals: {len(unique)} found")
     return unique
@@ -210,26 +262,20 @@ def _parse_funding_entry(entry, company_name: str) -> dict | None:
     date    = entry.get("published", "")
     summary = entry.get("summary", "")
 
-    funding_terms = r"(series [a-f]|seed round|raise[sd]|funding|invest|valuation|pre-seed)"
-    if not re.search(funding_terms, title + summary, re.I):
+    text = (title + summary).lower()
+    if not any(term in text for term in _FUNDING_TERMS):
         return None
 
     # Round type
-    round_match = re.search(
-        r"(seed|series [a-f]|pre-seed|growth|late.stage|ipo|spac)",
-        title + summary, re.I
-    )
+    round_match = _ROUND_RE.search(text)
     round_type = round_match.group(0).title() if round_match else "Unknown"
 
     # Amount
-    amount_match = re.search(
-        r"\$\s*([\d.]+)\s*(million|billion|M|B)\b",
-        title + summary, re.I
-    )
+    amount_match = _AMOUNT_RE.search(text)
     amount_usd = None
     if amount_match:
         num = float(amount_match.group(1))
-        unit = amount_match.group(2).lower()
+        unit = amount_match.group(2)
         amount_usd = num * 1_000_000_000 if "b" in unit else num * 1_000_000
 
     return {
@@ -283,12 +329,11 @@ def compute_fiscal_pressure(
     if funding_rounds:
         latest = funding_rounds[0]
         # Estimate months since last round
-        import re, datetime
         date_str = latest.get("date", "")
-        year_match = re.search(r"20\d{2}", date_str)
+        year_match = _YEAR_RE.search(date_str)
         if year_match:
             approx_year = int(year_match.group(0))
-            months_ago = (datetime.datetime.now().year - approx_year) * 12
+            months_ago = (datetime.now().year - approx_year) * 12
             if months_ago > 18:
                 score += 2
                 signals.append(f"Last funding ~{months_ago}m ago — runway pressure")
@@ -10,9 +10,11 @@ Rate limit: 60 req/hr unauthenticated, 5000/hr with token
 """
 import os
 import re
-import statistics
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from loguru import logger
+from utils.cache import cached, DAY
 
 try:
     from github import Github, GithubException
@@ -20,10 +22,13 @@ except ImportError:
     Github = None
 
 
-LEGACY_REPO_SIGNALS = [
+LEGACY_REPO_SIGNALS = (
     "legacy", "deprecated", "old-", "v1", "monolith", "migration",
     "archive", "technical-debt", "refactor", "rewrite"
-]
+)
+# One scan per repo; the lookahead also reports signals that overlap another hit
+_LEGACY_RE = re.compile("(?=(" + "|".join(map(re.escape, LEGACY_REPO_SIGNALS)) + "))")
+REPO_WORKERS = 8   # concurrent per-repo API calls (languages + commit stats)
 
 
 def scrape_github_org(org_name: str, company_name: str, token: str | None = None) -> dict:
@@ -46,41 +51,36 @@ def scrape_github_org(org_name: str, company_name: str, token: str | None = None
         total_open_issues  = 0
         total_stars        = 0
         commit_freqs       = []
-        languages          = {}
+        languages          = Counter()
         legacy_signals     = []
         repo_summaries     = []
 
-        for repo in repos:
+        # The two per-repo REST calls are pure latency — overlap them across repos
+        with ThreadPoolExecutor(max_workers=REPO_WORKERS) as ex:
+            repo_stats = list(ex.map(_fetch_repo_stats, repos))
+
+        now = datetime.now(timezone.utc)
+        for repo, (langs, commit_avg) in zip(repos, repo_stats):
             # Open issues
             total_open_issues += repo.open_issues_count
             total_stars       += repo.stargazers_count
 
             # Languages
-            try:
-                langs = repo.get_languages()
-                for lang, bytes_count in langs.items():
-                    languages[lang] = languages.get(lang, 0) + bytes_count
-            except GithubException:
-                pass
-
-            # Commit frequency (last 52 weeks)
-            try:
-                weekly_commits = repo.get_stats_commit_activity()
-                if weekly_commits:
-                    recent_4_weeks = [w.total for w in list(weekly_commits)[-4:]]
-                    avg = sum(recent_4_weeks) / 4 if recent_4_weeks else 0
-                    commit_freqs.append(avg)
-            except GithubException:
-                pass
+            languages.update(langs)
+
+            # Commit frequency (last 4 weeks)
+            if commit_avg is not None:
+                commit_freqs.append(commit_avg)
 
             # Legacy signals
             repo_text = (repo.name + " " + (repo.description or "")).lower()
-            for signal in LEGACY_REPO_SIGNALS:
-                if signal in repo_text:
-                    legacy_signals.append({"repo": repo.name, "signal": signal})
+            hits = set(_LEGACY_RE.findall(repo_text))
+            legacy_signals.extend(
+                {"repo": repo.name, "signal": signal} for signal in LEGACY_REPO_SIGNALS if signal in hits
+            )
 
             # How old is the repo's last commit?
-            days_since_update = (datetime.now(timezone.utc) - repo.updated_at).days if repo.updated_at else 999
+            days_since_update = (now - repo.updated_at).days if repo.updated_at else 999
 
             repo_summaries.append({
                 "name":               repo.name,
@@ -91,10 +91,9 @@ def scrape_github_org(org_name: str, company_name: str, token: str | None = None
             })
 
         # Sort languages by usage
-        top_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)
-        top_languages = [lang for lang, _ in top_languages[:10]]
+        top_languages = [lang for lang, _ in languages.most_common(10)]
 
-        avg_commit_freq = statistics.mean(commit_freqs) if commit_freqs else 0
+        avg_commit_freq = sum(commit_freqs) / len(commit_freqs) if commit_freqs else 0
 
         # Composite signals
         high_issue_repos = [r for r in repo_summaries if r["open_issues"] > 50]
@@ -133,6 +132,25 @@ def scrape_github_org(org_name: str, company_name: str, token: str | None = None
         return _empty_result(company_name, org_name)
 
 
+def _fetch_repo_stats(repo) -> tuple[dict, float | None]:
+    """Languages and avg weekly commits over the last 4 weeks for one repo."""
+    langs, commit_avg = {}, None
+    try:
+        langs = repo.get_languages()
+    except GithubException:
+        pass
+
+    # Commit frequency (last 52 weeks)
+    try:
+        weekly_commits = repo.get_stats_commit_activity()
+        if weekly_commits:
+            recent_4_weeks = [w.total for w in list(weekly_commits)[-4:]]
+            commit_avg = sum(recent_4_weeks) / 4 if recent_4_weeks else 0
+    except GithubException:
+        pass
+    return langs, commit_avg
+
+
 def find_github_org(company_name: str) -> str | None:
     """
     Attempt to find a company's GitHub org by guessing common slug formats.
@@ -141,31 +159,49 @@ def find_github_org(company_name: str) -> str | None:
     if Github is None:
         return None
 
-    slugs = _generate_slugs(company_name)
+    # Slugs only depend on the lowercased name, so that's the cache key
+    try:
+        return _resolve_github_org(" ".join(company_name.lower().split()))
+    except GithubException as e:
+        logger.debug(f"GitHub org lookup failed for '{company_name}': {e}")
+        return None
+
+
+@cached(ttl=30 * DAY, keep_empty=True)
+def _resolve_github_org(name: str) -> str | None:
+    """
+    Probe each slug; the answer (including "no org") is cached on disk for 30 days.
+    Errors other than 404 (rate limits, outages) propagate so they aren't cached as "absent".
+    """
     gh = Github(os.getenv("GITHUB_TOKEN"))
 
-    for slug in slugs:
+    for slug in _generate_slugs(name):
         try:
             org = gh.get_organization(slug)
-            logger.info(f"Found GitHub org for '{company_name}': {org.login}")
+            logger.info(f"Found GitHub org for '{name}': {org.login}")
             return org.login
-        except GithubException:
+        except GithubException as e:
+            if e.status != 404:
+                raise
             continue
 
-    logger.debug(f"No GitHub org found for '{company_name}'")
+    logger.debug(f"No GitHub org found for '{name}'")
     return None
 
 
-def _generate_slugs(name: str) -> list[str]:
+def _generate_slugs(name: str) -> tuple[str, ...]:
     """Generate possible GitHub org slug variants from a company name."""
     clean = re.sub(r"[^a-z0-9\s-]", "", name.lower()).strip()
     words = clean.split()
-    return [
+    if not words:   # no alphanumerics, nothing to probe
+        return ()
+    # dict.fromkeys drops repeats (e.g. single-word names) so no slug is probed twice
+    return tuple(dict.fromkeys((
         "".join(words),            # datavex
         "-".join(words),           # data-vex
         words[0],                  # data
         clean.replace(" ", ""),
-    ]
+    )))
 
 
 def _assess_github_debt(
@@ -6,10 +6,14 @@ Sources:
 Extracts: role title, department, description, strategic keywords
 """
 import re
+import asyncio
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+import lxml.html
 from loguru import logger
-from utils.http import safe_get, get_session
+from utils.http import (
+    async_safe_get, async_quick_get, get_async_client, HostLimiter,
+    extract_text_from_html_bytes, NON_TEXT_TAGS,
+)
 
 
 # ATS-specific job listing endpoints
@@ -27,63 +31,92 @@ TECH_DEBT_KEYWORDS = ["legacy", "migration", "moderniz", "refactor", "monolith",
 FISCAL_KEYWORDS    = ["cost reduction", "efficiency", "headcount", "lean", "profitable",
                       "streamline", "optimization", "runway", "burn rate"]
 
+_KEYWORD_BUCKETS = {
+    "pivot":     [(kw, kw.lower()) for kw in PIVOT_KEYWORDS],
+    "tech_debt": [(kw, kw.lower()) for kw in TECH_DEBT_KEYWORDS],
+    "fiscal":    [(kw, kw.lower()) for kw in FISCAL_KEYWORDS],
+}
+# All keywords in one pattern; the lookahead reports overlapping hits
+# ("cloud migration" and "migration") in a single scan, longest first.
+_KEYWORD_RE = re.compile("(?=(" + "|".join(
+    re.escape(low) for low in sorted({low for b in _KEYWORD_BUCKETS.values() for _, low in b},
+                                     key=len, reverse=True)
+) + "))")
+
+# Page chrome dropped from job descriptions
+JOB_NOISE_TAGS = NON_TEXT_TAGS | {"nav", "footer", "header"}
+
+# Matched against lowercased text, so no re.I casefolding per anchor
+_JOB_TERMS_RE = re.compile(r"(engineer|developer|manager|analyst|scientist|architect|designer|"
+                           r"sales|marketing|devops|sre|director|head of|vp |lead |senior |staff )")
+_URL_TERMS    = ("job", "careers", "openings", "positions", "apply", "role")
+_DATE_RE      = re.compile(r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*.{0,5}20\d{2}")
 
-def scrape_careers_page(careers_url: str, company_name: str, limit: int = 30) -> list[dict]:
+
+def scrape_careers_page(careers_url: str, company_name: str, limit: int = 30,
+                        direct: bool = True) -> list[dict]:
     """
     Attempt to scrape job listings from a careers page.
     Tries direct HTML parsing; falls back to known ATS endpoints.
+    direct=False skips the page itself (known dead) and goes straight to the ATS boards.
     Returns list of job dicts.
     """
-    session = get_session()
-    jobs = []
+    return asyncio.run(ascrape_careers_page(careers_url, company_name, limit, direct))
 
-    # Try direct page scrape first
-    jobs = _scrape_html_careers(careers_url, company_name, session, limit)
-
-    # If nothing found, try common ATS patterns
-    if not jobs:
-        slug = _guess_ats_slug(careers_url)
-        for ats, template in ATS_PATTERNS.items():
-            ats_url = template.format(slug=slug)
-            try:
-                jobs = _scrape_html_careers(ats_url, company_name, session, limit)
-                if jobs:
-                    logger.info(f"[{company_name}] Jobs found via {ats} ATS")
-                    break
-            except Exception:
-                continue
+
+async def ascrape_careers_page(careers_url: str, company_name: str, limit: int = 30,
+                               direct: bool = True) -> list[dict]:
+    """Async body of scrape_careers_page — job detail pages are fetched concurrently."""
+    jobs = []
+    async with get_async_client() as client:
+        hosts = HostLimiter()
+
+        # Try direct page scrape first
+        if direct:
+            jobs = await _scrape_html_careers(careers_url, company_name, client, hosts, limit)
+
+        # If nothing found, try common ATS patterns
+        if not jobs:
+            slug = _guess_ats_slug(careers_url)
+            for ats, template in ATS_PATTERNS.items():
+                ats_url = template.format(slug=slug)
+                try:
+                    jobs = await _scrape_html_careers(ats_url, company_name, client, hosts, limit,
+                                                      probe=True)
+                    if jobs:
+                        logger.info(f"[{company_name}] Jobs found via {ats} ATS")
+                        break
+                except Exception:
+                    continue
 
     logger.info(f"[{company_name}] Scraped {len(jobs)} job postings")
     return jobs
 
 
-def _scrape_html_careers(url: str, company_name: str, session, limit: int) -> list[dict]:
+async def _scrape_html_careers(url: str, company_name: str, client, hosts, limit: int,
+                               probe: bool = False) -> list[dict]:
+    """probe=True fetches the listing fail-fast (guessed ATS board, usually a 404)."""
     jobs = []
     try:
-        resp = safe_get(url, session)
-        soup = BeautifulSoup(resp.text, "lxml")
-
-        # Generic heuristic: find all links that look like job postings
-        job_links = []
-        for a in soup.find_all("a", href=True):
-            text = a.get_text(strip=True)
-            href = a["href"]
+        resp = await (async_quick_get if probe else async_safe_get)(url, client)
+        doc = lxml.html.fromstring(resp.content)
+
+        # Generic heuristic: find all links that look like job postings.
+        # Keyed by URL so duplicates collapse as we go; the first anchor text wins.
+        job_links = {}
+        for a in doc.xpath("//a[@href]"):
+            text = a.text_content().strip()
+            href = a.get("href")
             if _looks_like_job_link(text, href):
                 full_url = urljoin(url, href)
-                job_links.append((text, full_url))
+                job_links.setdefault(full_url, text)
 
-        # Deduplicate
-        seen = set()
-        unique_links = []
-        for t, u in job_links:
-            if u not in seen:
-                seen.add(u)
-                unique_links.append((t, u))
-
-        for title, job_url in unique_links[:limit]:
-            job = _scrape_job_detail(title, job_url, company_name, session)
-            if job:
-                jobs.append(job)
+        # Detail pages usually share one origin — the per-host cap keeps this polite
+        details = await asyncio.gather(*(
+            _scrape_job_detail(title, job_url, company_name, client, hosts(job_url))
+            for job_url, title in list(job_links.items())[:limit]
+        ))
+        jobs = [job for job in details if job]
 
     except Exception as e:
         logger.debug(f"Careers page scrape failed ({url}): {e}")
@@ -91,16 +124,13 @@ def _scrape_html_careers(url: str, company_name: str, session, limit: int) -> li
     return jobs
 
 
-def _scrape_job_detail(title: str, url: str, company_name: str, session) -> dict | None:
+async def _scrape_job_detail(title: str, url: str, company_name: str, client, host_sem) -> dict | None:
     try:
-        resp = safe_get(url, session)
-        soup = BeautifulSoup(resp.text, "lxml")
-
-        # Remove nav/footer noise
-        for tag in soup.select("nav, footer, header, script, style"):
-            tag.decompose()
+        async with host_sem:
+            resp = await async_safe_get(url, client)
 
-        description = soup.get_text(separator=" ", strip=True)[:5000]
+        # Skip nav/footer noise; parsing stops once 5000 chars of text are in
+        description = extract_text_from_html_bytes(resp.content, 5000, JOB_NOISE_TAGS)
         keywords = _extract_keywords(title + " " + description)
 
         return {
@@ -118,21 +148,21 @@ def _scrape_job_detail(title: str, url: str, company_name: str, session) -> dict
 
 
 def _looks_like_job_link(text: str, href: str) -> bool:
-    job_terms = r"(engineer|developer|manager|analyst|scientist|architect|designer|" \
-                r"sales|marketing|devops|sre|director|head of|vp |lead |senior |staff )"
-    url_terms  = r"(jobs|careers|openings|positions|apply|role|job)"
-    return bool(
-        re.search(job_terms, text, re.I) or
-        re.search(url_terms, href, re.I)
-    ) and len(text) > 3
+    # Cheapest rejections first: most anchors on a careers page are nav/footer links
+    if len(text) <= 3:
+        return False
+    href = href.lower()
+    if any(term in href for term in _URL_TERMS):
+        return True
+    return _JOB_TERMS_RE.search(text.lower()) is not None
 
 
 def _extract_keywords(text: str) -> dict:
-    text_lower = text.lower()
+    found = set(_KEYWORD_RE.findall(text.lower()))
+    # A keyword that's a prefix of a longer hit at the same spot still counts
     return {
-        "pivot":     [kw for kw in PIVOT_KEYWORDS     if kw.lower() in text_lower],
-        "tech_debt": [kw for kw in TECH_DEBT_KEYWORDS if kw.lower() in text_lower],
-        "fiscal":    [kw for kw in FISCAL_KEYWORDS    if kw.lower() in text_lower],
+        bucket: [kw for kw, low in kws if any(low in hit for hit in found)]
+        for bucket, kws in _KEYWORD_BUCKETS.items()
     }
 
 
@@ -161,5 +191,5 @@ def _guess_ats_from_url(url: str) -> str:
 
 
 def _extract_date(text: str) -> str:
-    match = re.search(r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*.{0,5}20\d{2}", text)
+    match = _DATE_RE.search(text)
     return match.group(0) if match else ""
@@ -7,13 +7,30 @@ Sources:
   4. Google News RSS
 """
 import re
-import feedparser
+import asyncio
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+import lxml.html
 from loguru import logger
-from utils.http import safe_get, get_session
+from utils.http import (
+    async_safe_get, async_quick_get, get_async_client, HostLimiter,
+    extract_text_from_html_bytes, NON_TEXT_TAGS,
+)
+from utils.feeds import parse_feed_items, afetch_news_feeds
+from utils.cache import cached, load_validators, store_validators, HOUR
 
-GOOGLE_NEWS_RSS = "https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
+RSS_PATHS = (
+    "/feed", "/rss", "/news/feed", "/blog/feed",
+    "/press/rss", "/newsroom/feed", "/news.rss",
+    "/atom.xml", "/feed.xml", "/rss.xml",
+)
+PRESS_HOST_CONCURRENCY = 5   # RSS probes and article fetches all hit the company's own host
+ARTICLE_NOISE_TAGS     = NON_TEXT_TAGS | {"nav", "footer", "header", "aside"}
+MAX_NEWS_ARTICLES      = 15
+NEAR_DUP_JACCARD       = 0.9   # same story re-published under another URL / lightly edited title
+SHINGLE_CHARS          = 5
+
+_DATE_RE         = re.compile(r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*.{0,5}20\d{2}")
+_ARTICLE_HREF_RE = re.compile(r"(news|press|blog|article|announcement|release|post)", re.I)
 
 # Pivot signal keywords in press releases
 PIVOT_TERMS = [
@@ -21,8 +38,15 @@ PIVOT_TERMS = [
     "restructur", "realign", "transform", "launch", "new platform", "AI-first",
     "leadership", "acqui", "partner", "rebrand", "new product", "new service",
 ]
+_PIVOT_TERMS_LOW = [(term, term.lower()) for term in PIVOT_TERMS]
+# All terms in one pattern, matched against lowercased text; the lookahead
+# reports overlapping hits in a single scan, longest first.
+_PIVOT_RE = re.compile("(?=(" + "|".join(
+    re.escape(low) for low in sorted({low for _, low in _PIVOT_TERMS_LOW}, key=len, reverse=True)
+) + "))")
 
 
+@cached(ttl=HOUR)
 def scrape_press_releases(
     company_name: str,
     domain: str,
@@ -33,21 +57,7 @@ def scrape_press_releases(
     Aggregate press releases from multiple sources.
     Returns list of dicts with {title, content, published_date, source_url}.
     """
-    results = []
-
-    # 1. Try RSS feed first (fastest)
-    rss_results = _try_rss_feeds(domain, company_name)
-    results.extend(rss_results)
-
-    # 2. Try company news page
-    if news_page_url and len(results) < limit:
-        html_results = _scrape_news_page(news_page_url, company_name)
-        results.extend(html_results)
-
-    # 3. Google News RSS as fallback
-    if len(results) < 5:
-        gn_results = _scrape_google_news(company_name)
-        results.extend(gn_results)
+    results = asyncio.run(_afetch_releases(company_name, domain, news_page_url, limit))
 
     # Deduplicate by URL
     seen, unique = set(), []
@@ -56,6 +66,9 @@ def scrape_press_releases(
             seen.add(r["source_url"])
             unique.append(r)
 
+    # Same story surfaced by several sources under different URLs
+    unique = _drop_near_duplicates(unique)
+
     # Tag each release with detected signals
     for pr in unique:
         pr["pivot_signals"] = _detect_pivot_signals(pr["title"] + " " + pr.get("content", ""))
@@ -64,61 +77,112 @@ def scrape_press_releases(
     return unique[:limit]
 
 
-def _try_rss_feeds(domain: str, company_name: str) -> list[dict]:
-    """Try common RSS feed paths on the company domain."""
+async def _afetch_releases(company_name: str, domain: str,
+                           news_page_url: str | None, limit: int) -> list[dict]:
+    """
+    Async body of scrape_press_releases — every source shares one client, and
+    each stage's requests (feed probes, articles, news queries) run concurrently.
+    """
+    async with get_async_client() as client:
+        hosts = HostLimiter(default=PRESS_HOST_CONCURRENCY)
+
+        # 1. Try RSS feed first (fastest)
+        results = await _try_rss_feeds(domain, company_name, client, hosts)
+
+        # 2. Try company news page — fetching only as many new articles as the limit still needs
+        if news_page_url:
+            known  = {r["source_url"] for r in results}
+            wanted = limit - len(known)
+            if wanted > 0:
+                results.extend(await _scrape_news_page(
+                    news_page_url, company_name, client, hosts, known, min(wanted, MAX_NEWS_ARTICLES)
+                ))
+
+        # 3. Google News RSS as fallback
+        if len(results) < 5:
+            results.extend(await _scrape_google_news(company_name, client))
+
+    return results
+
+
+async def _limited_get(url: str, client, host_sem, timeout: int = 20):
+    async with host_sem:
+        return await async_safe_get(url, client, timeout=timeout)
+
+
+async def _try_rss_feeds(domain: str, company_name: str, client, hosts) -> list[dict]:
+    """
+    Try common RSS feed paths on the company domain.
+    All paths are probed at once; the first one (in RSS_PATHS order) with entries wins.
+    """
     results = []
-    session = get_session()
     base = domain if domain.startswith("http") else f"https://{domain}"
+    urls = [base + path for path in RSS_PATHS]
 
-    rss_paths = [
-        "/feed", "/rss", "/news/feed", "/blog/feed",
-        "/press/rss", "/newsroom/feed", "/news.rss",
-        "/atom.xml", "/feed.xml", "/rss.xml",
-    ]
+    feeds = await asyncio.gather(
+        *(_probe_feed(url, client, hosts(url)) for url in urls), return_exceptions=True
+    )
 
-    for path in rss_paths:
-        url = base + path
-        try:
-            resp = safe_get(url, session, timeout=8)
-            if "xml" in resp.headers.get("content-type", "") or resp.text.strip().startswith("<?xml"):
-                feed = feedparser.parse(resp.text)
-                for entry in feed.entries[:15]:
-                    results.append({
-                        "company_name":   company_name,
-                        "title":          entry.get("title", ""),
-                        "content":        entry.get("summary", "")[:3000],
-                        "published_date": entry.get("published", ""),
-                        "source_url":     entry.get("link", url),
-                    })
-                if results:
-                    logger.info(f"[{company_name}] RSS found at {url}")
-                    break
-        except Exception:
+    for url, entries in zip(urls, feeds):
+        if isinstance(entries, Exception) or not entries:
             continue
+        results = [{
+            "company_name":   company_name,
+            "title":          entry["title"],
+            "content":        entry["summary"][:3000],
+            "published_date": entry["published"],
+            "source_url":     entry["link"] or url,
+        } for entry in entries]
+        logger.info(f"[{company_name}] RSS found at {url}")
+        break
 
     return results
 
 
-def _scrape_news_page(news_url: str, company_name: str) -> list[dict]:
-    """Crawl a company's news/press page and extract article links."""
+async def _probe_feed(url: str, client, host_sem) -> list[dict]:
+    """
+    Fetch and parse one candidate feed URL. A feed seen before is revalidated with
+    its ETag / Last-Modified, so an unchanged one costs a bodiless 304 and no parse.
+    """
+    headers, stored = load_validators(url)
+    async with host_sem:
+        resp = await async_quick_get(url, client, headers=headers)
+    if resp.status_code == 304:
+        return stored or []
+
+    if "xml" in resp.headers.get("content-type", "") or resp.content.lstrip().startswith(b"<?xml"):
+        entries = parse_feed_items(resp.content, 15)
+        store_validators(url, resp.headers, entries)
+        return entries
+    return []
+
+
+async def _scrape_news_page(news_url: str, company_name: str, client, hosts,
+                            known: set = frozenset(), max_articles: int = MAX_NEWS_ARTICLES) -> list[dict]:
+    """
+    Crawl a company's news/press page and extract article links.
+    Links already in `known` (e.g. found via RSS) aren't fetched again.
+    """
     results = []
-    session = get_session()
     try:
-        resp = safe_get(news_url, session)
-        soup = BeautifulSoup(resp.text, "lxml")
-
-        article_links = []
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(strip=True)
-            full_url = urljoin(news_url, href)
-            if _looks_like_article(text, href) and full_url not in article_links:
-                article_links.append((text, full_url))
-
-        for title, article_url in article_links[:15]:
-            article = _fetch_article(title, article_url, company_name, session)
-            if article:
-                results.append(article)
+        resp = await _limited_get(news_url, client, hosts(news_url))
+        doc = lxml.html.fromstring(resp.content)
+
+        # Keyed by URL so repeated links collapse; the first anchor text wins
+        article_links = {}
+        for a in doc.xpath("//a[@href]"):
+            href = a.get("href")
+            text = a.text_content().strip()
+            if _looks_like_article(text, href):
+                full_url = urljoin(news_url, href)
+                if full_url not in known:
+                    article_links.setdefault(full_url, text)
+
+        articles = await asyncio.gather(*(
+            _fetch_article(title, article_url, company_name, client, hosts(article_url))
+            for article_url, title in list(article_links.items())[:max_articles]
+        ))
+        results = [article for article in articles if article]
 
     except Exception as e:
         logger.debug(f"News page scrape failed ({news_url}): {e}")
@@ -126,13 +190,11 @@ def _scrape_news_page(news_url: str, company_name: str) -> list[dict]:
     return results
 
 
-def _fetch_article(title: str, url: str, company_name: str, session) -> dict | None:
+async def _fetch_article(title: str, url: str, company_name: str, client, host_sem) -> dict | None:
     try:
-        resp = safe_get(url, session)
-        soup = BeautifulSoup(resp.text, "lxml")
-        for tag in soup.select("nav, footer, header, script, style, aside"):
-            tag.decompose()
-        content = soup.get_text(separator=" ", strip=True)[:4000]
+        resp = await _limited_get(url, client, host_sem)
+        # Skip nav/footer noise; parsing stops once 4000 chars of text are in
+        content = extract_text_from_html_bytes(resp.content, 4000, ARTICLE_NOISE_TAGS)
         date = _extract_date(content)
         return {
             "company_name":   company_name,
@@ -145,43 +207,72 @@ def _fetch_article(title: str, url: str, company_name: str, session) -> dict | N
         return None
 
 
-def _scrape_google_news(company_name: str) -> list[dict]:
-    """Get recent news via Google News RSS."""
+async def _scrape_google_news(company_name: str, client) -> list[dict]:
+    """Get recent news via Google News RSS — the queries are fetched concurrently."""
     results = []
     queries = [
         f"{company_name} announcement",
         f"{company_name} launch",
         f"{company_name} strategy",
     ]
-    for q in queries:
-        url = GOOGLE_NEWS_RSS.format(query=q.replace(" ", "+"))
-        try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:5]:
-                results.append({
-                    "company_name":   company_name,
-                    "title":          entry.get("title", ""),
-                    "content":        entry.get("summary", "")[:2000],
-                    "published_date": entry.get("published", ""),
-                    "source_url":     entry.get("link", ""),
-                })
-        except Exception as e:
-            logger.debug(f"Google News RSS failed: {e}")
+    for entries in await afetch_news_feeds(queries, 5, client):
+        if isinstance(entries, Exception):
+            logger.debug(f"Google News RSS failed: {entries}")
+            continue
+        for entry in entries:
+            results.append({
+                "company_name":   company_name,
+                "title":          entry["title"],
+                "content":        entry["summary"][:2000],
+                "published_date": entry["published"],
+                "source_url":     entry["link"],
+            })
     return results
 
 
+def _drop_near_duplicates(releases: list[dict]) -> list[dict]:
+    """
+    Drop releases whose title + opening text is near-identical to an earlier one.
+    Sources are merged primary-first (own RSS, own news page, Google News), so the
+    copy kept is the company's own. Pairwise Jaccard over character shingles is exact
+    and cheap at this size (tens of releases), so no LSH index is needed.
+    """
+    kept, kept_shingles = [], []
+    for pr in releases:
+        shingles = _shingles(pr["title"] + " " + pr.get("content", "")[:500])
+        if not any(_jaccard(shingles, other) >= NEAR_DUP_JACCARD for other in kept_shingles):
+            kept.append(pr)
+            kept_shingles.append(shingles)
+    return kept
+
+
+def _shingles(text: str) -> frozenset:
+    text = " ".join(text.lower().split())
+    return frozenset(text[i:i + SHINGLE_CHARS] for i in range(len(text) - SHINGLE_CHARS + 1))
+
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    # |a∩b|/|a∪b| can't exceed the size ratio, so lopsided pairs skip the set ops
+    small, large = sorted((len(a), len(b)))
+    if small < NEAR_DUP_JACCARD * large:
+        return small / large
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
 def _detect_pivot_signals(text: str) -> list[str]:
-    text_lower = text.lower()
-    return [term for term in PIVOT_TERMS if term.lower() in text_lower]
+    found = set(_PIVOT_RE.findall(text.lower()))
+    # A term inside a longer hit at the same spot still counts
+    return [term for term, low in _PIVOT_TERMS_LOW if any(low in hit for hit in found)]
 
 
 def _looks_like_article(text: str, href: str) -> bool:
-    return bool(
-        len(text) > 10 and
-        re.search(r"(news|press|blog|article|announcement|release|post)", href, re.I)
-    )
+    # Length first — it rejects most nav/footer anchors without touching the regex
+    return len(text) > 10 and _ARTICLE_HREF_RE.search(href) is not None
 
 
 def _extract_date(text: str) -> str:
-    match = re.search(r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*.{0,5}20\d{2}", text)
+    match = _DATE_RE.search(text)
     return match.group(0) if match else ""
@@ -9,6 +9,7 @@ import re
 from bs4 import BeautifulSoup
 from loguru import logger
 from utils.http import safe_get, get_session
+from utils.cache import cached, DAY
 
 
 # Fingerprint rules: (pattern_in_html_or_header, tech_name, is_legacy)
@@ -65,38 +66,9 @@ def detect_tech_stack(domain: str, company_name: str) -> dict:
     Fetch company homepage and detect tech stack.
     Returns structured dict ready for DB insertion.
     """
-    url = _normalize_url(domain)
-    session = get_session()
-    frameworks, languages, raw_headers, debt_signals = [], [], {}, []
-
-    try:
-        resp = safe_get(url, session, timeout=15)
-        html  = resp.text
-        headers_lower = {k.lower(): v.lower() for k, v in resp.headers.items()}
-
-        # Combine HTML + headers for scanning
-        combined = html + " " + str(headers_lower)
-
-        detected = _run_fingerprints(combined)
-        frameworks = [d["tech"] for d in detected]
-        debt_signals = [d["tech"] for d in detected if d["is_legacy"]]
-
-        # Extract inline languages from script src
-        languages = _detect_languages(html, headers_lower)
-
-        # Save relevant headers
-        raw_headers = {
-            k: headers_lower[k]
-            for k in ["server", "x-powered-by", "x-frame-options", "content-type", "via"]
-            if k in headers_lower
-        }
-
-        logger.info(
-            f"[{company_name}] Stack: {frameworks} | Legacy signals: {debt_signals}"
-        )
-
-    except Exception as e:
-        logger.warning(f"Tech stack detect failed ({domain}): {e}")
+    scan = _scan_homepage(_normalize_url(domain), company_name) or {}
+    frameworks   = scan.get("frameworks", [])
+    debt_signals = scan.get("debt_signals", [])
 
     legacy_score = min(10, len(debt_signals) * 2.5)  # crude 0-10 score
 
@@ -104,8 +76,8 @@ def detect_tech_stack(domain: str, company_name: str) -> dict:
         "company_name": company_name,
         "domain":       domain,
         "frameworks":   frameworks,
-        "languages":    languages,
-        "raw_headers":  raw_headers,
+        "languages":    scan.get("languages", []),
+        "raw_headers":  scan.get("raw_headers", {}),
         "debt_signals": {
             "detected_legacy_tech": debt_signals,
             "legacy_score":         legacy_score,
@@ -114,6 +86,46 @@ def detect_tech_stack(domain: str, company_name: str) -> dict:
     }
 
 
+@cached(ttl=DAY)
+def _scan_homepage(url: str, company_name: str) -> dict | None:
+    """
+    Fingerprint the homepage's HTML and headers.
+    Returns None when the fetch fails, so a failed detection isn't cached.
+    """
+    try:
+        resp = safe_get(url, get_session(), timeout=15)
+    except Exception as e:
+        logger.warning(f"Tech stack detect failed ({url}): {e}")
+        return None
+
+    html  = resp.text
+    headers_lower = {k.lower(): v.lower() for k, v in resp.headers.items()}
+
+    # Combine HTML + headers for scanning
+    combined = html + " " + str(headers_lower)
+
+    detected = _run_fingerprints(combined)
+    frameworks = [d["tech"] for d in detected]
+    debt_signals = [d["tech"] for d in detected if d["is_legacy"]]
+
+    logger.info(
+        f"[{company_name}] Stack: {frameworks} | Legacy signals: {debt_signals}"
+    )
+
+    return {
+        "frameworks":   frameworks,
+        "debt_signals": debt_signals,
+        # Extract inline languages from script src
+        "languages":    _detect_languages(html, headers_lower),
+        # Save relevant headers
+        "raw_headers":  {
+            k: headers_lower[k]
+            for k in ["server", "x-powered-by", "x-frame-options", "content-type", "via"]
+            if k in headers_lower
+        },
+    }
+
+
 def _run_fingerprints(text: str) -> list[dict]:
     found = []
     seen  = set()
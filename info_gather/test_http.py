@@ -0,0 +1,60 @@
+"""
+DataVex Info Gather — HTML Text Extraction Tests
+Checks the lxml text target against get_text(separator=" ", strip=True) behaviour (no network needed).
+"""
+import importlib.util
+import os
+
+# Load this tree's utils/http.py by path — a bare `utils` import resolves to
+# whichever scraper tree (this one or datavex-srivatsa) is first on sys.path
+_spec = importlib.util.spec_from_file_location(
+    "info_gather_utils_http",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "utils", "http.py"),
+)
+_http = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_http)
+
+STREAM_CHUNK_BYTES           = _http.STREAM_CHUNK_BYTES
+extract_text_from_html_bytes = _http.extract_text_from_html_bytes
+
+
+def test_entities_stay_in_their_word():
+    html = b"<p>AT&amp;T reported <b>Caf&eacute;</b> sales&nbsp;up</p>"
+    assert extract_text_from_html_bytes(html) == "AT&T reported Café sales up"
+    print("  ✓ Entities don't split text nodes")
+
+
+def test_word_across_chunk_boundary():
+    # "word" starts two bytes before the first feed boundary
+    pad = b"<p>" + b"x" * (STREAM_CHUNK_BYTES - 5) + b" "
+    text = extract_text_from_html_bytes(pad + b"word rest</p>", max_chars=10 * STREAM_CHUNK_BYTES)
+    assert text.endswith(" word rest"), text[-20:]
+    print("  ✓ Word split across feed chunks")
+
+
+def test_nodes_joined_and_stripped():
+    html = b"<div> one <span>two</span>\n three <script>var x = 1;</script><p>  </p>four</div>"
+    assert extract_text_from_html_bytes(html) == "one two three four"
+    print("  ✓ Nodes stripped, joined with spaces, scripts dropped")
+
+
+def test_cap():
+    assert len(extract_text_from_html_bytes(b"<p>" + b"x" * 200_000 + b"</p>", max_chars=1000)) == 1000
+    assert extract_text_from_html_bytes(b"<p>" + b" " * 200 + b"hello</p>", max_chars=10) == "hello"
+    print("  ✓ Text capped at max_chars")
+
+
+def main():
+    print("\n  DataVex Info Gather — HTML Text Extraction Tests")
+    print("  " + "─" * 45)
+
+    test_entities_stay_in_their_word()
+    test_word_across_chunk_boundary()
+    test_nodes_joined_and_stripped()
+    test_cap()
+
+    print("\n  All 4 text extraction tests passed ✓\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+RSS/Atom helpers shared by the news and press-release scrapers.
+Feeds are parsed with an lxml parser target, keeping only the four fields
+the scrapers read from the first `limit` entries.
+"""
+import asyncio
+from urllib.parse import quote_plus
+from lxml import etree
+from loguru import logger
+from utils.http import async_safe_get, get_async_client
+
+GOOGLE_NEWS_RSS = "https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
+
+_ATOM       = "{http://www.w3.org/2005/Atom}"
+_ATOM_LINK  = f"{_ATOM}link"
+_ENTRY_TAGS = frozenset({"item", f"{_ATOM}entry"})
+_FIELD_TAGS = frozenset({"title", "link", "pubDate", "description"} | {
+    f"{_ATOM}{name}" for name in ("title", "published", "updated", "summary", "content")
+})
+
+
+def parse_feed_items(content: bytes, limit: int) -> list[dict]:
+    """
+    Pull title/link/published/summary from the first `limit` RSS <item>s or Atom <entry>s.
+    Parsed through a target, so no element tree is built for the rest of the feed.
+    """
+    target = _FeedTarget(limit)
+    parser = etree.XMLParser(target=target, recover=True, resolve_entities=False)
+    try:
+        parser.feed(content)
+        return parser.close()
+    except etree.LxmlError as e:
+        logger.debug(f"Feed parse failed: {e}")
+        return target.items
+
+
+class _FeedTarget:
+    """
+    lxml parser target keeping only the fields the scrapers read from each entry:
+    the text of its direct title/link/date/summary children (like findtext) and
+    the Atom alternate link. Entries past `limit` are skipped.
+    """
+    def __init__(self, limit: int):
+        self.items   = []
+        self.limit   = limit
+        self._entry  = None    # raw child texts of the entry being read, by tag
+        self._depth  = 0       # depth below the entry element
+        self._field  = None    # direct child whose text is being collected
+        self._text   = []
+        self._nested = False   # inside a child of that field — its text isn't the field's
+
+    def start(self, tag, attrib):
+        if self._entry is None:
+            if tag in _ENTRY_TAGS and len(self.items) < self.limit:
+                self._entry, self._depth = {}, 0
+            return
+        self._depth += 1
+        if self._depth == 1:
+            if tag in _FIELD_TAGS and tag not in self._entry:
+                self._field, self._text, self._nested = tag, [], False
+            elif tag == _ATOM_LINK and _ATOM_LINK not in self._entry \
+                    and attrib.get("rel", "alternate") == "alternate":
+                self._entry[_ATOM_LINK] = attrib.get("href", "")
+        elif self._field is not None:
+            self._nested = True
+
+    def end(self, tag):
+        if self._entry is None:
+            return
+        if self._depth == 0:
+            self.items.append(_rss_item(self._entry) if tag == "item" else _atom_entry(self._entry))
+            self._entry = None
+            return
+        if self._depth == 1 and tag == self._field:
+            self._entry[tag] = "".join(self._text)
+            self._field = None
+        self._depth -= 1
+
+    def data(self, data):
+        if self._field is not None and not self._nested:
+            self._text.append(data)
+
+    def close(self):
+        return self.items
+
+
+def _rss_item(fields: dict) -> dict:
+    return {
+        "title":     fields.get("title") or "",
+        "link":      fields.get("link") or "",
+        "published": fields.get("pubDate") or "",
+        "summary":   fields.get("description") or "",
+    }
+
+
+def _atom_entry(fields: dict) -> dict:
+    return {
+        "title":     fields.get(f"{_ATOM}title") or "",
+        "link":      fields.get(_ATOM_LINK) or "",
+        "published": fields.get(f"{_ATOM}published") or fields.get(f"{_ATOM}updated") or "",
+        "summary":   fields.get(f"{_ATOM}summary") or fields.get(f"{_ATOM}content") or "",
+    }
+
+
+def fetch_news_feeds(queries: list[str], limit: int) -> list:
+    """
+    Fetch the Google News RSS feed for every query concurrently.
+    Returns the first `limit` items per query, in order, or the exception it failed with.
+    """
+    return asyncio.run(afetch_news_feeds(queries, limit))
+
+
+async def afetch_news_feeds(queries: list[str], limit: int, client=None) -> list:
+    """Async body of fetch_news_feeds; pass a client to reuse a crawl's open connections."""
+    if client is None:
+        async with get_async_client() as client:
+            return await afetch_news_feeds(queries, limit, client)
+
+    urls = [GOOGLE_NEWS_RSS.format(query=quote_plus(q)) for q in queries]
+    responses = await asyncio.gather(
+        *(async_safe_get(url, client) for url in urls), return_exceptions=True
+    )
+    return [r if isinstance(r, Exception) else parse_feed_items(r.content, limit) for r in responses]
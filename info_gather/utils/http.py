@@ -1,9 +1,43 @@
+import os
 import time
 import random
+import threading
+import asyncio
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from lxml import etree
 from tenacity import retry, stop_after_attempt, wait_exponential
 from loguru import logger
 
+try:
+    import h2  # noqa: F401 — enables HTTP/2 in httpx
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+try:
+    import pypdfium2 as pdfium
+    HAS_PDFIUM = True
+except ImportError:
+    HAS_PDFIUM = False
+
+STREAM_CHUNK_BYTES = 65536
+MAX_TEXT_CHARS     = 50000       # transcripts are stored capped at 50k chars
+MAX_PDF_BYTES      = 4_000_000   # a truncated PDF won't parse, so oversize ones are skipped
+MAX_HTML_BYTES     = 2_000_000
+
+# Seconds slept before each polite request; async_quick_get skips it
+POLITE_DELAY_RANGE = (1.0, 2.5)
+RETRY_ATTEMPTS     = 3
+RETRY_WAIT_MIN     = 2
+RETRY_WAIT_MAX     = 10
+
+# Concurrent requests allowed per host in the async crawlers (SEC asks for ≤10 req/s)
+HOST_CONCURRENCY         = {"sec.gov": 5, "www.sec.gov": 5}
+DEFAULT_HOST_CONCURRENCY = 10
+
 HEADERS_POOL = [
     {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36",
@@ -19,23 +53,253 @@ HEADERS_POOL = [
     },
 ]
 
+_retry = retry(stop=stop_after_attempt(RETRY_ATTEMPTS),
+               wait=wait_exponential(multiplier=1, min=RETRY_WAIT_MIN, max=RETRY_WAIT_MAX))
+
+def _polite_sleep():
+    time.sleep(random.uniform(*POLITE_DELAY_RANGE))
+
+_local = threading.local()
+
 def get_session() -> requests.Session:
-    session = requests.Session()
-    session.headers.update(random.choice(HEADERS_POOL))
+    """
+    Per-thread keep-alive Session shared by every scraper on that thread, so
+    repeat hits on a host (ATS job pages, Yahoo, RSS) reuse pooled connections
+    instead of paying a fresh TCP+TLS handshake each time. requests.Session
+    isn't thread-safe, so the analyze_company stage threads each get their own.
+    Rebuilt after a fork.
+    safe_get rotates the browser headers per request on top of the session default.
+    Retries are left to safe_get's tenacity policy so they don't compound.
+    """
+    session = getattr(_local, "session", None)
+    if session is None or _local.pid != os.getpid():
+        session = requests.Session()
+        session.headers.update(random.choice(HEADERS_POOL))   # default for direct session calls
+        session.headers["Connection"] = "keep-alive"
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _local.session, _local.pid = session, os.getpid()
     return session
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-def safe_get(url: str, session: requests.Session | None = None, timeout: int = 20, **kwargs) -> requests.Response:
+def _rotate_headers(session, kwargs: dict):
+    # One pooled Session serves every host, so rotate the browser headers per request.
+    # httpx clients keep their own (EDGAR needs its declared User-Agent).
+    if isinstance(session, requests.Session):
+        kwargs["headers"] = {**random.choice(HEADERS_POOL), **(kwargs.get("headers") or {})}
+
+@_retry
+def safe_get(url: str, session: requests.Session | httpx.Client | None = None, timeout: int = 20, **kwargs) -> requests.Response:
     """GET with automatic retry and polite delay."""
-    time.sleep(random.uniform(1.0, 2.5))   # polite crawl delay
+    _polite_sleep()
     s = session or get_session()
+    _rotate_headers(s, kwargs)
 
     resp = s.get(url, timeout=timeout, **kwargs)
     resp.raise_for_status()
     return resp
 
+def get_http2_client(headers: dict | None = None) -> httpx.Client:
+    """
+    Keep-alive httpx client for hosts hit many times in a row (SEC EDGAR).
+    Requests share pooled connections, multiplexed over HTTP/2 when h2 is installed.
+    Thread-safe, so one client can back a worker pool.
+    """
+    return httpx.Client(
+        http2=HAS_H2,
+        headers=headers or random.choice(HEADERS_POOL),
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=httpx.Timeout(10.0),
+        follow_redirects=True,
+    )
+
+@_retry
+def safe_stream(url: str, client: httpx.Client, timeout: int = 20) -> httpx.Response:
+    """Streamed GET on an httpx client: body is read lazily, caller must close() the response."""
+    _polite_sleep()
+    resp = client.send(client.build_request("GET", url, timeout=timeout), stream=True)
+    try:
+        resp.raise_for_status()
+    except httpx.HTTPStatusError:
+        resp.close()
+        raise
+    return resp
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Async client for one crawl (one asyncio.run) — connections to an origin are
+    pooled and multiplexed over HTTP/2 when h2 is installed.
+    """
+    return httpx.AsyncClient(
+        http2=HAS_H2,
+        headers=random.choice(HEADERS_POOL),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=20,
+        follow_redirects=True,
+    )
+
+@_retry
+async def async_safe_get(url: str, client: httpx.AsyncClient, timeout: int = 20, **kwargs) -> httpx.Response:
+    """
+    Async counterpart of safe_get — same polite delay and retry policy.
+    A 304 is returned rather than raised; it only comes back to conditional requests.
+    """
+    await asyncio.sleep(random.uniform(*POLITE_DELAY_RANGE))
+    resp = await client.get(url, timeout=timeout, **kwargs)
+    if resp.status_code != 304:
+        resp.raise_for_status()
+    return resp
+
+async def async_quick_get(url: str, client: httpx.AsyncClient, timeout: int = 8, **kwargs) -> httpx.Response:
+    """
+    Async GET with NO delay and NO retry — for probing guessed URLs (ATS boards,
+    feed paths) where most are expected to 404, so misses fail fast.
+    A 304 is returned rather than raised, as in async_safe_get.
+    """
+    resp = await client.get(url, timeout=timeout, **kwargs)
+    if resp.status_code != 304:
+        resp.raise_for_status()
+    return resp
+
+@_retry
+async def async_safe_get_capped(url: str, client: httpx.AsyncClient, max_bytes: int,
+                                timeout: int = 20) -> tuple[bytes, bool]:
+    """
+    Streamed async GET that stops reading after max_bytes.
+    Returns (body, truncated) so callers can decide whether a partial body is usable.
+    """
+    await asyncio.sleep(random.uniform(*POLITE_DELAY_RANGE))
+    buf = bytearray()
+    async with client.stream("GET", url, timeout=timeout) as resp:
+        resp.raise_for_status()
+        async for chunk in resp.aiter_bytes(STREAM_CHUNK_BYTES):
+            buf += chunk
+            if len(buf) > max_bytes:
+                return bytes(buf[:max_bytes]), True
+    return bytes(buf), False
+
+NON_TEXT_TAGS = frozenset({"script", "style", "noscript", "template"})
+
+class _TextTarget:
+    """
+    lxml parser target collecting visible text, like get_text(separator=" ", strip=True).
+    lxml may hand one text node over in several data() calls (around entities, at
+    feed boundaries), so pieces are buffered and each node is stripped once at the
+    next tag. Stops keeping text once cap chars are held, so a huge node can't blow
+    past the cap. Text inside any of skip_tags is dropped.
+    """
+    def __init__(self, cap: int, skip_tags=NON_TEXT_TAGS):
+        self.parts     = []
+        self.size      = 0
+        self.cap       = cap
+        self.skip_tags = skip_tags
+        self._skip     = 0
+        self._buf      = []    # pieces of the text node being read
+        self._buf_len  = 0
+
+    def start(self, tag, attrib):
+        self._flush()
+        if tag in self.skip_tags:
+            self._skip += 1
+
+    def end(self, tag):
+        self._flush()
+        if tag in self.skip_tags and self._skip:
+            self._skip -= 1
+
+    def data(self, data):
+        if self._skip or self.size > self.cap:
+            return
+        self._buf.append(data)
+        self._buf_len += len(data)
+        if self._buf_len > self.cap - self.size + 1:
+            # Leading whitespace is stripped anyway; once the node's text alone
+            # fills the cap, keep what fits and stop
+            text = "".join(self._buf).lstrip()
+            self._buf, self._buf_len = [text], len(text)
+            if self._buf_len > self.cap - self.size + 1:
+                self._flush()
+
+    def _flush(self):
+        if not self._buf:
+            return
+        data = "".join(self._buf).strip()
+        self._buf, self._buf_len = [], 0
+        if data:
+            data = data[:self.cap - self.size + 1]
+            self.parts.append(data)
+            self.size += len(data) + 1
+
+    def close(self):
+        self._flush()
+        return " ".join(self.parts)
+
+def extract_text_from_html_stream(chunks, max_chars: int = MAX_TEXT_CHARS,
+                                  skip_tags=NON_TEXT_TAGS) -> str:
+    """
+    Feed HTML byte chunks into an incremental lxml parser and stop as soon as
+    max_chars of text are collected — the rest of the document is never parsed.
+    """
+    target = _TextTarget(max_chars, skip_tags)
+    parser = etree.HTMLParser(target=target)
+    for chunk in chunks:
+        if chunk:
+            parser.feed(chunk)
+        if target.size > max_chars:
+            break
+    return parser.close()[:max_chars]
+
+def extract_text_from_html_bytes(body: bytes, max_chars: int = MAX_TEXT_CHARS,
+                                 skip_tags=NON_TEXT_TAGS) -> str:
+    """extract_text_from_html_stream over an in-memory body, fed one chunk at a time."""
+    return extract_text_from_html_stream(
+        (body[i:i + STREAM_CHUNK_BYTES] for i in range(0, len(body), STREAM_CHUNK_BYTES)),
+        max_chars, skip_tags,
+    )
+
+class HostLimiter:
+    """
+    Per-host BoundedSemaphore registry for one crawl.
+    Create it inside the running event loop — asyncio primitives can't be
+    shared across asyncio.run() calls, so there is no module-level registry.
+    """
+    def __init__(self, limits: dict | None = None, default: int = DEFAULT_HOST_CONCURRENCY):
+        self.limits  = HOST_CONCURRENCY if limits is None else limits
+        self.default = default
+        self._sems: dict[str, asyncio.BoundedSemaphore] = {}
+
+    def __call__(self, url: str) -> asyncio.BoundedSemaphore:
+        host = urlparse(url).hostname or ""
+        sem = self._sems.get(host)
+        if sem is None:
+            sem = self._sems[host] = asyncio.BoundedSemaphore(self.limits.get(host, self.default))
+        return sem
+
 def extract_text_from_pdf_bytes(pdf_bytes: bytes) -> str:
-    """Extract plain text from a PDF given as raw bytes. Pure Python, no C deps."""
+    """
+    Extract plain text from a PDF given as raw bytes.
+    Uses PDFium (C) page by page when pypdfium2 is installed; pdfminer (pure Python)
+    otherwise, and for any PDF PDFium refuses.
+    """
+    if HAS_PDFIUM:
+        try:
+            return _pdfium_text(pdf_bytes)
+        except pdfium.PdfiumError as e:
+            logger.debug(f"PDFium failed, falling back to pdfminer: {e}")
+
     import io
     from pdfminer.high_level import extract_text
     return extract_text(io.BytesIO(pdf_bytes))
+
+def _pdfium_text(pdf_bytes: bytes) -> str:
+    # Each page's text buffer is released before the next page is loaded
+    doc, parts = pdfium.PdfDocument(pdf_bytes), []
+    try:
+        for page in doc:
+            textpage = page.get_textpage()
+            parts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+    finally:
+        doc.close()
+    return "\n".join(parts)
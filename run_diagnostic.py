@@ -2,7 +2,7 @@
 DataVex Agent Diagnostic — Run each agent individually, capture raw output.
 This script tests each of the 5 pipeline agents step-by-step.
 """
-import sys, os, json, time
+import sys, os, json, time, argparse, atexit
 
 # Add pipeline to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "datavex_pipeline"))
@@ -18,12 +18,22 @@ os.environ["BYTEZ_API_KEY"] = os.getenv("BYTEZ_API_KEY", "ollama")
 os.environ["BYTEZ_BASE_URL"] = os.getenv("BYTEZ_BASE_URL", "http://100.109.131.90:11434/v1")
 
 OUTPUT_FILE = os.path.join(os.path.dirname(__file__), "agent_diagnostic.txt")
+CACHE_DIR   = os.path.join(os.path.dirname(__file__), ".datavex", "cache")
+PROBE_TTL   = 3600  # seconds a successful LLM probe is trusted for
+
+parser = argparse.ArgumentParser(description="Run the pipeline agents one by one and log their raw output.")
+parser.add_argument("--only", default="",
+                    help="comma-separated agents to run (e.g. agent2,agent4); the others reuse their last cached output")
+parser.add_argument("--cached-probe", action="store_true",
+                    help="reuse an LLM connection probe from the last hour instead of calling the LLM (not a live check)")
+ARGS = parser.parse_args()
+ONLY = {a.strip().lower() for a in ARGS.only.split(",") if a.strip()}
 
 def log(msg):
     """Print and write to file."""
     print(msg)
-    with open(OUTPUT_FILE, "a") as f:
-        f.write(msg + "\n")
+    _OUT.write(msg)
+    _OUT.write("\n")
 
 def dump_obj(label, obj, indent=2):
     """Dump a Pydantic model or dict to readable text."""
@@ -39,6 +49,38 @@ def dump_obj(label, obj, indent=2):
     log(f"{'─'*60}")
     log(text)
 
+def cache_path(agent):
+    return os.path.join(CACHE_DIR, f"{agent}.json")
+
+def should_run(agent):
+    """Run an agent unless --only leaves it out and its output from a previous run is cached."""
+    return not ONLY or agent in ONLY or not os.path.exists(cache_path(agent))
+
+def save_output(agent, items):
+    """Cache an agent's output so later --only runs can start from it."""
+    data = [i.model_dump() if hasattr(i, "model_dump") else i for i in items]
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(cache_path(agent), "w") as f:
+        json.dump(data, f, default=str, ensure_ascii=False)
+
+def load_output(agent, model=None):
+    """Load an agent's cached output, rebuilding Pydantic objects when given a model."""
+    with open(cache_path(agent)) as f:
+        data = json.load(f)
+    items = [model(**d) for d in data] if model else data
+    log(f"  ↺ Skipped (--only) — loaded {len(items)} items from {cache_path(agent)}")
+    return items
+
+def load_probe():
+    """Return the last successful LLM probe for this model/URL if it is recent enough (--cached-probe only)."""
+    try:
+        with open(cache_path("llm_probe")) as f:
+            probe = json.load(f)
+    except (OSError, ValueError):
+        return None
+    same_target = (probe.get("model"), probe.get("base_url")) == (LLM_MODEL, OPENAI_BASE_URL)
+    return probe if same_target and time.time() - probe.get("time", 0) < PROBE_TTL else None
+
 # ── Clear output file ──
 with open(OUTPUT_FILE, "w") as f:
     f.write("=" * 70 + "\n")
@@ -48,6 +90,10 @@ with open(OUTPUT_FILE, "w") as f:
     f.write(f"  Time: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
     f.write("=" * 70 + "\n\n")
 
+# One line-buffered handle for every log() call instead of reopening per line
+_OUT = open(OUTPUT_FILE, "a", buffering=1)
+atexit.register(_OUT.close)
+
 # ── Check config ──
 log("\n[STEP 0] Checking LLM config...")
 from config import OFFLINE_MODE, LLM_MODEL, OPENAI_BASE_URL, client
@@ -65,18 +111,28 @@ else:
 # Test LLM with a simple call
 if client:
     log("\n[STEP 0.5] Testing LLM connection with a simple prompt...")
-    try:
-        t0 = time.time()
-        resp = client.chat.completions.create(
-            model=LLM_MODEL,
-            messages=[{"role": "user", "content": "Say 'hello datavex' and nothing else."}],
-            temperature=0.1,
-            max_tokens=20,
-        )
-        answer = resp.choices[0].message.content.strip()
-        log(f"  ✓ LLM responded in {time.time()-t0:.1f}s: '{answer}'")
-    except Exception as e:
-        log(f"  ✗ LLM connection FAILED: {e}")
+    probe = load_probe() if ARGS.cached_probe else None
+    if probe:
+        log(f"  ↺ NOT VERIFIED this run (--cached-probe) — LLM last responded "
+            f"{time.time() - probe['time']:.0f}s ago in {probe['elapsed']:.1f}s: '{probe['answer']}'")
+    else:
+        try:
+            t0 = time.time()
+            resp = client.chat.completions.create(
+                model=LLM_MODEL,
+                messages=[{"role": "user", "content": "Say 'hello datavex' and nothing else."}],
+                temperature=0.1,
+                max_tokens=20,
+            )
+            answer = resp.choices[0].message.content.strip()
+            elapsed = time.time() - t0
+            log(f"  ✓ LLM responded in {elapsed:.1f}s: '{answer}'")
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(cache_path("llm_probe"), "w") as f:
+                json.dump({"model": LLM_MODEL, "base_url": OPENAI_BASE_URL, "time": time.time(),
+                           "elapsed": elapsed, "answer": answer}, f)
+        except Exception as e:
+            log(f"  ✗ LLM connection FAILED: {e}")
 
 # ════════════════════════════════════════════════════════════
 # AGENT 1 — Target Discovery
@@ -85,38 +141,42 @@ log("\n\n" + "=" * 70)
 log("  AGENT 1 — TARGET DISCOVERY")
 log("=" * 70)
 
-from models import UserIntent, DealProfile
+from models import UserIntent, DealProfile, CandidateCompany
 import agent1_discovery
 
-intent = UserIntent(raw_text="AI analytics, data platform, and ML database companies looking for data engineering and cloud modernization")
-profile = DealProfile()
+if not should_run("agent1"):
+    candidates = load_output("agent1", CandidateCompany)
+else:
+    intent = UserIntent(raw_text="AI analytics, data platform, and ML database companies looking for data engineering and cloud modernization")
+    profile = DealProfile()
 
-log(f"\n  Input: {intent.raw_text}")
-log(f"  Deal: min=${profile.min_deal_usd:,}, max=${profile.max_deal_usd:,}, regions={profile.target_regions}, sizes={profile.preferred_company_sizes}")
+    log(f"\n  Input: {intent.raw_text}")
+    log(f"  Deal: min=${profile.min_deal_usd:,}, max=${profile.max_deal_usd:,}, regions={profile.target_regions}, sizes={profile.preferred_company_sizes}")
 
-t1 = time.time()
-try:
-    candidates = agent1_discovery.run(intent, profile)
-    log(f"\n  ✓ Agent 1 completed in {time.time()-t1:.1f}s — found {len(candidates)} candidates")
-    
-    for i, c in enumerate(candidates):
-        dump_obj(f"Candidate {i+1}: {c.company_name}", c)
-        log(f"\n  Summary: {c.company_name} | {c.industry} | {c.size} | {c.estimated_employees} emp | {c.region}")
-        log(f"           cap_score={c.capability_score:.3f} | size_fit={c.size_fit:.1f} | geo_fit={c.geo_fit:.1f} | ind_fit={c.industry_fit:.1f}")
-        log(f"           TOTAL MATCH SCORE = {c.initial_match_score:.3f}")
-        
-        # Verdict
-        if c.initial_match_score >= 0.6:
-            log(f"           VERDICT: ✓ STRONG MATCH")
-        elif c.initial_match_score >= 0.4:
-            log(f"           VERDICT: ~ MODERATE MATCH")
-        else:
-            log(f"           VERDICT: ✗ WEAK MATCH (below 0.4 threshold)")
-except Exception as e:
-    log(f"\n  ✗ AGENT 1 FAILED: {e}")
-    import traceback
-    log(traceback.format_exc())
-    candidates = []
+    t1 = time.time()
+    try:
+        candidates = agent1_discovery.run(intent, profile)
+        save_output("agent1", candidates)
+        log(f"\n  ✓ Agent 1 completed in {time.time()-t1:.1f}s — found {len(candidates)} candidates")
+
+        for i, c in enumerate(candidates):
+            dump_obj(f"Candidate {i+1}: {c.company_name}", c)
+            log(f"\n  Summary: {c.company_name} | {c.industry} | {c.size} | {c.estimated_employees} emp | {c.region}")
+            log(f"           cap_score={c.capability_score:.3f} | size_fit={c.size_fit:.1f} | geo_fit={c.geo_fit:.1f} | ind_fit={c.industry_fit:.1f}")
+            log(f"           TOTAL MATCH SCORE = {c.initial_match_score:.3f}")
+
+            # Verdict
+            if c.initial_match_score >= 0.6:
+                log(f"           VERDICT: ✓ STRONG MATCH")
+            elif c.initial_match_score >= 0.4:
+                log(f"           VERDICT: ~ MODERATE MATCH")
+            else:
+                log(f"           VERDICT: ✗ WEAK MATCH (below 0.4 threshold)")
+    except Exception as e:
+        log(f"\n  ✗ AGENT 1 FAILED: {e}")
+        import traceback
+        log(traceback.format_exc())
+        candidates = []
 
 # ════════════════════════════════════════════════════════════
 # AGENT 2 — Signal Extraction
@@ -125,7 +185,9 @@ log("\n\n" + "=" * 70)
 log("  AGENT 2 — SIGNAL EXTRACTION")
 log("=" * 70)
 
-if not candidates:
+if not should_run("agent2"):
+    all_signals = load_output("agent2")
+elif not candidates:
     log("  ⚠ Skipping — no candidates from Agent 1")
     all_signals = []
 else:
@@ -134,6 +196,7 @@ else:
     t2 = time.time()
     try:
         all_signals = agent2_signals.run(candidates)
+        save_output("agent2", all_signals)
         log(f"\n  ✓ Agent 2 completed in {time.time()-t2:.1f}s — signals for {len(all_signals)} companies")
         
         for i, sig in enumerate(all_signals):
@@ -180,7 +243,9 @@ log("\n\n" + "=" * 70)
 log("  AGENT 3 — OPPORTUNITY SCORING")
 log("=" * 70)
 
-if not candidates or not all_signals:
+if not should_run("agent3"):
+    opportunities = load_output("agent3")
+elif not candidates or not all_signals:
     log("  ⚠ Skipping — missing data from previous agents")
     opportunities = []
 else:
@@ -189,6 +254,7 @@ else:
     t3 = time.time()
     try:
         opportunities = agent3_scoring.run(candidates, all_signals)
+        save_output("agent3", opportunities)
         log(f"\n  ✓ Agent 3 completed in {time.time()-t3:.1f}s — scored {len(opportunities)} companies")
         
         for i, opp in enumerate(opportunities):
@@ -227,7 +293,9 @@ log("\n\n" + "=" * 70)
 log("  AGENT 4 — DECISION MAKER")
 log("=" * 70)
 
-if not opportunities or not all_signals:
+if not should_run("agent4"):
+    decision_makers = load_output("agent4")
+elif not opportunities or not all_signals:
     log("  ⚠ Skipping — missing data from previous agents")
     decision_makers = []
 else:
@@ -236,6 +304,7 @@ else:
     t4 = time.time()
     try:
         decision_makers = agent4_decision_maker.run(opportunities, all_signals)
+        save_output("agent4", decision_makers)
         log(f"\n  ✓ Agent 4 completed in {time.time()-t4:.1f}s — DMs for {len(decision_makers)} companies")
         
         for i, dm_out in enumerate(decision_makers):
@@ -267,7 +336,9 @@ log("\n\n" + "=" * 70)
 log("  AGENT 5 — OUTREACH GENERATION")
 log("=" * 70)
 
-if not opportunities or not all_signals or not decision_makers:
+if not should_run("agent5"):
+    outreach_kits = load_output("agent5")
+elif not opportunities or not all_signals or not decision_makers:
     log("  ⚠ Skipping — missing data from previous agents")
 else:
     import agent5_outreach
@@ -275,6 +346,7 @@ else:
     t5 = time.time()
     try:
         outreach_kits = agent5_outreach.run(opportunities, all_signals, decision_makers)
+        save_output("agent5", outreach_kits)
         log(f"\n  ✓ Agent 5 completed in {time.time()-t5:.1f}s — outreach for {len(outreach_kits)} companies")
         
         for i, out in enumerate(outreach_kits):
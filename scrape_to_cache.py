@@ -11,8 +11,19 @@ Usage:
 Then run:
     python seed_db.py
 """
-import sys, os, json, re, time, random
+import sys, os, json, re, time, random, asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from itertools import islice
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # ── Path setup ─────────────────────────────────────────────────
 ROOT     = os.path.dirname(os.path.abspath(__file__))
@@ -20,13 +31,20 @@ SCRAPER_DIR = os.path.join(ROOT, "info_gather", "datavex-srivatsa", "info_gather
 PIPELINE_DIR = os.path.join(ROOT, "datavex_pipeline")
 CACHE_PATH  = os.path.join(ROOT, "datavex_pipeline", "search_cache.json")
 
+SCRAPE_PHASES = 6   # scraper calls per company: tech, press, funding, layoffs, yahoo, jobs
+
 sys.path.insert(0, SCRAPER_DIR)
 sys.path.insert(0, PIPELINE_DIR)  # for datavex_pipeline/config.py LLM client
 
 # ── Import scrapers ────────────────────────────────────────────
-from scrapers.tech_stack    import detect_tech_stack
+from scrapers.tech_stack    import scan_homepage, build_tech_stack
 from scrapers.press_releases import scrape_press_releases
 from scrapers.financials    import scrape_yahoo_finance, scrape_funding_news, scrape_layoff_news
+from utils import cache as scrape_cache
+
+# Each scraper's result is reused from the on-disk cache for its own TTL
+# (see the @cached decorators). Set FORCE_REFRESH=1 to bypass it for a run.
+scrape_cache.set_enabled(os.getenv("FORCE_REFRESH", "").strip().lower() in ("", "0", "false", "no"))
 
 try:
     from scrapers.jobs import scrape_careers_page
@@ -119,26 +137,44 @@ COMPANIES = [
 
 # ── Helpers ────────────────────────────────────────────────────
 
-def estimate_recency(date_str: str) -> int:
-    """Convert a published date string to approximate recency_days."""
+# Date shapes seen in scraped feeds, checked before parsing so misses don't raise
+_RFC2822_DATE_RE = re.compile(r"^[A-Z][a-z]{2}, \d")      # "Tue, 04 Jun 2024 10:00:00 GMT" (RSS)
+_ISO_DATE_RE     = re.compile(r"^\d{4}-\d{2}-\d{2}T")      # "2024-06-04T10:00:00Z"
+_LONG_DATE_RE    = re.compile(r"^[A-Z][a-z]+ \d")          # "June 4, 2024"
+
+
+@lru_cache(maxsize=512)   # feeds repeat the same pubDate strings across articles
+def _parse_date(date_str: str) -> datetime | None:
+    try:
+        if _RFC2822_DATE_RE.match(date_str):
+            return parsedate_to_datetime(date_str)
+        if _ISO_DATE_RE.match(date_str):
+            return datetime.fromisoformat(date_str)
+        if _LONG_DATE_RE.match(date_str):
+            return datetime.strptime(date_str, "%B %d, %Y")
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def estimate_recency(date_str: str, now: datetime | None = None) -> int:
+    """
+    Convert a published date string to approximate recency_days.
+    Pass `now` when scoring many dates so they share one reference time.
+    """
     if not date_str:
         return 90
-    now = datetime.now(timezone.utc)
-    for fmt in ["%a, %d %b %Y %H:%M:%S %z", "%Y-%m-%dT%H:%M:%SZ", "%B %d, %Y"]:
-        try:
-            dt = datetime.strptime(date_str.strip(), fmt)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return max(1, (now - dt).days)
-        except ValueError:
-            continue
-    return 90
+    dt = _parse_date(date_str.strip())
+    if dt is None:
+        return 90
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return max(1, ((now or datetime.now(timezone.utc)) - dt).days)
 
 
 def safe_text(text: str, maxlen: int = 200) -> str:
     """Clean and truncate text."""
-    t = re.sub(r"\s+", " ", str(text)).strip()
-    return t[:maxlen] if len(t) > maxlen else t
+    return " ".join(str(text).split())[:maxlen]
 
 
 def make_signal(text: str, source: str, recency_days: int,
@@ -182,21 +218,18 @@ def extract_tech_signals(tech: dict, company_name: str) -> list[dict]:
     return signals
 
 
-def extract_funding_signals(funding: list[dict]) -> list[dict]:
-    signals = []
-    for f in funding[:5]:
-        headline = f.get("headline", "") or f.get("title", "")
-        if not headline or len(headline) < 10:
-            continue
-        rec = estimate_recency(f.get("date", ""))
-        signals.append(make_signal(
+def extract_funding_signals(funding: list[dict], now: datetime | None = None) -> list[dict]:
+    headlines = ((f, f.get("headline") or f.get("title") or "") for f in funding[:5])
+    return [
+        make_signal(
             headline,
             source=f.get("source_url", "Google News RSS"),
-            recency_days=rec,
+            recency_days=estimate_recency(f.get("date", ""), now),
             verified=True,
             verification_source=f.get("source_url", ""),
-        ))
-    return signals
+        )
+        for f, headline in headlines if len(headline) >= 10
+    ]
 
 
 def extract_finance_signals(financials: list[dict], company_name: str) -> list[dict]:
@@ -236,7 +269,7 @@ def extract_finance_signals(financials: list[dict], company_name: str) -> list[d
     return signals
 
 
-def extract_press_signals(articles: list[dict]) -> list[dict]:
+def extract_press_signals(articles: list[dict], now: datetime | None = None) -> list[dict]:
     """Convert press release articles → product signals."""
     signals = []
     seen = set()
@@ -250,8 +283,8 @@ def extract_press_signals(articles: list[dict]) -> list[dict]:
             continue
         seen.add(title)
 
-        text = safe_text(title + (f". {content[:100]}" if content else ""))
-        rec = estimate_recency(date)
+        text = f"{title}. {content[:100]}" if content else title   # make_signal cleans it
+        rec = estimate_recency(date, now)
         # RSS source = company's own feed → verified
         is_rss = "rss" in a.get("_source", "") or "rss" in url
         signals.append(make_signal(
@@ -271,21 +304,14 @@ def extract_job_signals(jobs: list[dict], company_name: str) -> list[dict]:
         return signals
 
     # Count depts
-    depts = {}
-    for j in jobs:
-        d = j.get("department", "Other")
-        depts[d] = depts.get(d, 0) + 1
-
-    top_depts = sorted(depts.items(), key=lambda x: -x[1])[:3]
+    depts = Counter(j.get("department", "Other") for j in jobs)
+    top_depts = depts.most_common(3)
     dept_str = ", ".join(f"{d} ({n})" for d, n in top_depts)
 
     # Keyword extraction
     pivot_kws = set()
-    debt_kws  = set()
     for j in jobs[:15]:
-        kw = j.get("keywords", {})
-        pivot_kws.update(kw.get("pivot", []))
-        debt_kws.update(kw.get("tech_debt", []))
+        pivot_kws.update(j.get("keywords", {}).get("pivot", []))
 
     source_type = jobs[0].get("source", "html")
     verified = source_type in ("greenhouse", "lever", "ashby")
@@ -294,7 +320,7 @@ def extract_job_signals(jobs: list[dict], company_name: str) -> list[dict]:
 
     text = f"{company_name} has {len(jobs)} open roles — top depts: {dept_str}."
     if pivot_kws:
-        text += f" AI/ML keywords in JDs: {', '.join(list(pivot_kws)[:3])}."
+        text += f" AI/ML keywords in JDs: {', '.join(islice(pivot_kws, 3))}."
     signals.append(make_signal(
         text,
         source=source_label,
@@ -318,21 +344,17 @@ def extract_job_signals(jobs: list[dict], company_name: str) -> list[dict]:
     return signals
 
 
-def extract_layoff_signals(layoffs: list[dict]) -> list[dict]:
-    signals = []
-    for l in layoffs[:3]:
-        headline = l.get("headline", "")
-        if not headline or len(headline) < 10:
-            continue
-        rec = estimate_recency(l.get("date", ""))
-        signals.append(make_signal(
-            headline,
+def extract_layoff_signals(layoffs: list[dict], now: datetime | None = None) -> list[dict]:
+    return [
+        make_signal(
+            l["headline"],
             source=l.get("source_url", "Google News"),
-            recency_days=rec,
+            recency_days=estimate_recency(l.get("date", ""), now),
             verified=True,
             verification_source=l.get("source_url", ""),
-        ))
-    return signals
+        )
+        for l in layoffs[:3] if len(l.get("headline") or "") >= 10
+    ]
 
 
 # ── LLM Intel Generation ──────────────────────────────────────
@@ -350,17 +372,20 @@ def _signal_summary(signals: dict, max_signals: int = 6) -> str:
     return "\n".join(lines) if lines else "  No signals scraped."
 
 
-def generate_llm_intel(name: str, cfg: dict, signals: dict) -> dict:
+async def generate_llm_intel(name: str, cfg: dict, signals: dict) -> dict:
     """
     Call the LLM to generate:
       - Decision maker persona (role, pain points, messaging angle)
       - Outreach subject + email body
     Uses ONLY scraped signals as input — no manual data.
     Returns dict with 'llm_persona' and 'llm_outreach' keys.
-    Gracefully returns {} in OFFLINE_MODE.
+    Gracefully returns {} in OFFLINE_MODE or when nothing was scraped.
     """
     if OFFLINE_MODE or not llm_call_with_retry:
         return {}
+    if not any(signals.values()):
+        print(f"  [LLM] No signals for {name} — skipping LLM")
+        return {}
 
     sig_text = _signal_summary(signals)
     industry = cfg.get("industry", "")
@@ -370,7 +395,8 @@ def generate_llm_intel(name: str, cfg: dict, signals: dict) -> dict:
 
     print(f"  [LLM] Generating persona for {name}...")
     try:
-        persona_result = llm_call_with_retry(
+        persona_result = await asyncio.to_thread(
+            llm_call_with_retry,
             prompt=(
                 f"Company: {name}\n"
                 f"Industry: {industry}\n"
@@ -395,7 +421,8 @@ def generate_llm_intel(name: str, cfg: dict, signals: dict) -> dict:
     try:
         role = persona_result.get("role", "CTO / Technical Leader")
         angle = persona_result.get("messaging_angle", "")
-        outreach_result = llm_call_with_retry(
+        outreach_result = await asyncio.to_thread(
+            llm_call_with_retry,
             prompt=(
                 f"Company: {name} ({industry}, {region})\n"
                 f"Target persona: {role}\n"
@@ -425,24 +452,54 @@ def generate_llm_intel(name: str, cfg: dict, signals: dict) -> dict:
 
 # ── Main ───────────────────────────────────────────────────────
 
-def scrape_company(cfg: dict) -> dict:
+def _encode_cache(cache: dict) -> bytes:
+    """Serialise search_cache.json with orjson (C, bytes straight out) when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(cache, option=orjson.OPT_INDENT_2)
+    return json.dumps(cache, indent=2).encode()
+
+
+def _unwrap(result):
+    """Re-raise a scraper exception captured by asyncio.gather(return_exceptions=True)."""
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+async def scrape_company(cfg: dict) -> dict:
     name    = cfg["name"]
     domain  = cfg["domain"]
     ticker  = cfg.get("ticker")
     careers = cfg.get("careers_url")
     news_pg = cfg.get("news_url")
 
+    # The scrapers are sync and network-bound — run them all at once in
+    # worker threads, then report each phase in order below.
+    phases = {
+        "tech":    asyncio.to_thread(scan_homepage, domain, name),
+        "press":   asyncio.to_thread(scrape_press_releases, name, domain,
+                                     news_page_url=news_pg, limit=10),
+        "funding": asyncio.to_thread(scrape_funding_news, name),
+        "layoffs": asyncio.to_thread(scrape_layoff_news, name, domain),
+    }
+    if ticker:
+        phases["yahoo"] = asyncio.to_thread(scrape_yahoo_finance, ticker, name)
+    if careers and HAS_JOBS:
+        phases["jobs"] = asyncio.to_thread(scrape_careers_page, careers, name, limit=25)
+    results = dict(zip(phases, await asyncio.gather(*phases.values(), return_exceptions=True)))
+
     print(f"\n{'='*55}")
     print(f"Scraping: {name}")
     print(f"{'='*55}")
 
     signals  = {"funding": [], "careers": [], "product": [], "infra": []}
     dm_list  = []
+    now      = datetime.now(timezone.utc)   # one reference time for every recency_days below
 
     # 1. Tech stack (always, any company with a domain)
     print(f"  [1/5] Tech stack → {domain}")
     try:
-        tech = detect_tech_stack(domain, name)
+        tech = build_tech_stack(domain, name, _unwrap(results["tech"]))
         infra_from_tech = extract_tech_signals(tech, name)
         signals["infra"].extend(infra_from_tech)
         print(f"        → {len(tech.get('frameworks', []))} frameworks, "
@@ -453,8 +510,8 @@ def scrape_company(cfg: dict) -> dict:
     # 2. Press releases (Google News RSS always kicks in as fallback)
     print(f"  [2/5] Press releases → {name}")
     try:
-        articles = scrape_press_releases(name, domain, news_page_url=news_pg, limit=10)
-        prod_signals = extract_press_signals(articles)
+        articles = _unwrap(results["press"])
+        prod_signals = extract_press_signals(articles, now)
         signals["product"].extend(prod_signals)
         print(f"        → {len(articles)} articles, {len(prod_signals)} signals")
     except Exception as e:
@@ -463,8 +520,8 @@ def scrape_company(cfg: dict) -> dict:
     # 3. Funding news (Google News RSS — works for any company by name)
     print(f"  [3/5] Funding news → {name}")
     try:
-        funding = scrape_funding_news(name)
-        fund_signals = extract_funding_signals(funding)
+        funding = _unwrap(results["funding"])
+        fund_signals = extract_funding_signals(funding, now)
         signals["funding"].extend(fund_signals)
         print(f"        → {len(funding)} rounds, {len(fund_signals)} signals")
     except Exception as e:
@@ -474,7 +531,7 @@ def scrape_company(cfg: dict) -> dict:
     if ticker:
         print(f"  [4/5] Yahoo Finance → {ticker}")
         try:
-            financials = scrape_yahoo_finance(ticker, name)
+            financials = _unwrap(results["yahoo"])
             fin_signals = extract_finance_signals(financials, name)
             signals["funding"].extend(fin_signals)
             print(f"        → {len(financials)} statements, {len(fin_signals)} signals")
@@ -487,7 +544,7 @@ def scrape_company(cfg: dict) -> dict:
     if careers and HAS_JOBS:
         print(f"  [5/5] Careers → {careers}")
         try:
-            jobs = scrape_careers_page(careers, name, limit=25)
+            jobs = _unwrap(results["jobs"])
             job_signals = extract_job_signals(jobs, name)
             signals["careers"].extend(job_signals)
             print(f"        → {len(jobs)} jobs, {len(job_signals)} signals")
@@ -506,8 +563,8 @@ def scrape_company(cfg: dict) -> dict:
     # 6. Layoff risk signals
     print(f"  [+] Layoff check → {name}")
     try:
-        layoffs = scrape_layoff_news(name, domain)
-        layoff_sigs = extract_layoff_signals(layoffs)
+        layoffs = _unwrap(results["layoffs"])
+        layoff_sigs = extract_layoff_signals(layoffs, now)
         signals["infra"].extend(layoff_sigs)  # Layoffs = infra/risk signal
         print(f"        → {len(layoffs)} layoff events")
     except Exception as e:
@@ -516,8 +573,10 @@ def scrape_company(cfg: dict) -> dict:
     # Remove empty categories
     signals = {k: v for k, v in signals.items() if v}
 
-    total = sum(len(v) for v in signals.values())
-    verified = sum(1 for v in signals.values() for s in v if s.get("verified"))
+    total = verified = 0
+    for items in signals.values():
+        total    += len(items)
+        verified += sum(1 for s in items if s["verified"])   # make_signal always sets it
     print(f"\n  ✓ Done: {total} signals ({verified} verified, {total - verified} unverified)")
 
     return {
@@ -537,32 +596,52 @@ def scrape_company(cfg: dict) -> dict:
     }
 
 
-def main():
+async def process_company(cfg: dict) -> dict:
+    """Scrape one company, then enrich it with the LLM (persona before outreach)."""
+    result = await scrape_company(cfg)
+
+    # ── LLM enrichment (uses scraped signals only) ────
+    llm_intel = await generate_llm_intel(cfg["name"], cfg, result.get("signals", {}))
+    if llm_intel:
+        result.update(llm_intel)  # adds 'llm_persona' and 'llm_outreach'
+    return result
+
+
+async def main():
     # Load existing cache
     if os.path.exists(CACHE_PATH):
-        with open(CACHE_PATH) as f:
-            cache = json.load(f)
+        with open(CACHE_PATH, "rb") as f:
+            previous = f.read()
+        cache = (orjson.loads(previous) if HAS_ORJSON else json.loads(previous)) if previous else {}
     else:
-        cache = {}
+        previous, cache = b"", {}
+
+    # Scrape and enrich every company concurrently.
+    # One worker thread per scraper call so none wait on a small default pool.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=len(COMPANIES) * SCRAPE_PHASES)
+    )
+    processed = await asyncio.gather(*(process_company(cfg) for cfg in COMPANIES), return_exceptions=True)
 
-    for cfg in COMPANIES:
+    for cfg, result in zip(COMPANIES, processed):
         name = cfg["name"]
         try:
-            result = scrape_company(cfg)
-
-            # ── LLM enrichment (uses scraped signals only) ────
-            llm_intel = generate_llm_intel(name, cfg, result.get("signals", {}))
-            if llm_intel:
-                result.update(llm_intel)  # adds 'llm_persona' and 'llm_outreach'
-
-            cache[name] = result
+            cache[name] = _unwrap(result)
         except Exception as e:
             print(f"\n\u2717 FATAL error scraping {name}: {e}")
             import traceback; traceback.print_exc()
 
-    # Save cache
-    with open(CACHE_PATH, "w") as f:
-        json.dump(cache, f, indent=2)
+    # Save cache — skipped when nothing changed since the last run
+    encoded = _encode_cache(cache)
+    if encoded != previous:
+        # Write a sibling file and rename it over the cache, so a crash mid-write
+        # leaves the previous search_cache.json intact rather than truncated
+        tmp_path = CACHE_PATH + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(encoded)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, CACHE_PATH)
 
     print(f"\n\n{'='*55}")
     print(f"\u2705 search_cache.json updated \u2014 {len(COMPANIES)} companies scraped")
@@ -575,4 +654,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
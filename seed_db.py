@@ -6,22 +6,44 @@ Run this once on a fresh device to populate the database from search_cache.json.
 Usage:
     cd datavex
     source .venv/bin/activate
-    python seed_db.py
+    python seed_db.py                 # add --skip-agent6 to leave out the RAG/LLM recommendations
+                                      # add --quiet to print only failures and the summary
 """
-import sys, os, json
+import sys, os, json, csv, io, re, argparse
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'datavex_pipeline'))
 
 from app.database import SessionLocal, CompanyRecord, Base, engine
-from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy import insert, select, update
+from collections import Counter
 from datetime import datetime, timezone
 
-# Agent 6 — RAG recommender (optional, graceful if unavailable)
 try:
-    import agent6_recommender
-    HAS_AGENT6 = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_AGENT6 = False
+    HAS_ORJSON = False
+
+parser = argparse.ArgumentParser(description="Seed the DataVex database from search_cache.json.")
+parser.add_argument('--skip-agent6', action='store_true',
+                    help="don't call the Agent 6 recommender (one RAG + LLM round-trip per company)")
+parser.add_argument('--quiet', action='store_true',
+                    help="only print failures and the final summary, not a line per company")
+ARGS = parser.parse_args()
+
+def log(msg):
+    """Per-company progress line, silenced by --quiet."""
+    if not ARGS.quiet:
+        print(msg)
+
+# Agent 6 — RAG recommender (optional, graceful if unavailable)
+HAS_AGENT6 = False
+if not ARGS.skip_agent6:
+    try:
+        import agent6_recommender
+        HAS_AGENT6 = True
+    except ImportError:
+        pass
 
 def utcnow():
     return datetime.now(timezone.utc)
@@ -31,8 +53,8 @@ Base.metadata.create_all(bind=engine)
 
 # ── Load cache ────────────────────────────────────────────────
 CACHE_PATH = os.path.join(os.path.dirname(__file__), 'datavex_pipeline', 'search_cache.json')
-with open(CACHE_PATH) as f:
-    CACHE = json.load(f)
+with open(CACHE_PATH, 'rb') as f:
+    CACHE = orjson.loads(f.read()) if HAS_ORJSON else json.load(f)
 
 SIGNAL_PATTERNS = {
     'HIRING':  ['hiring', 'open roles', 'expanding team', 'workforce', 'engineer roles', 'data engineer'],
@@ -44,12 +66,14 @@ SIGNAL_PATTERNS = {
     'GTM':     ['partnership', 'reseller', 'enterprise agreement', 'customer', 'signed', 'deployed', 'contract'],
 }
 
+# One alternation per category, tried in SIGNAL_PATTERNS order so earlier categories win
+CLASSIFY_RES = [(sig_type, re.compile('|'.join(map(re.escape, kws)))) for sig_type, kws in SIGNAL_PATTERNS.items()]
+
 def classify(text):
     t = text.lower()
-    for sig_type, kws in SIGNAL_PATTERNS.items():
-        for kw in kws:
-            if kw in t:
-                return sig_type
+    for sig_type, pattern in CLASSIFY_RES:
+        if pattern.search(t):
+            return sig_type
     return 'PRODUCT'
 
 def priority_from(score):
@@ -64,6 +88,34 @@ def strategy_from(intent, conv):
         return 'CO_BUILD', 'co-development with internal data team', 'joint ML pipeline optimization session', 'VP Engineering / Director Data', 'cold_email'
     return 'MONITOR', 'share AI insights and case studies', 'send domain-specific AI case study', 'Technical Leader / Director', 'linkedin'
 
+# Fixed wording for the template outreach and receptivity label
+SIGNAL_PHRASES = {
+    'HIRING':'rapid hiring and team expansion','FUNDING':'recent funding and capital deployment',
+    'INFRA':'increasing infrastructure complexity','PRODUCT':'new product/platform launches',
+    'GTM':'enterprise partnerships and go-to-market expansion'
+}
+STRATEGY_ANGLES = {'BUILD_HEAVY':'accelerate delivery and reduce infra burden','CO_BUILD':'augment your internal team to ship faster','MONITOR':'share insights and stay aligned'}
+RECEPTIVITY = {'HIGH':'HIGH — ACT WITHIN 90 DAYS','MEDIUM':'MODERATE — ACT WITHIN 6 MONTHS','LOW':'LOW — MONITOR'}
+
+COPY_COLUMNS = ('id', 'scan_id', 'name', 'descriptor', 'score', 'confidence',
+                'coverage', 'data', 'created_at', 'updated_at')
+
+def bulk_copy(db, rows):
+    """Stream new company rows into Postgres with COPY ... FROM STDIN, inside the session's transaction."""
+    # Encode `data` with the engine's own JSON serializer, so COPY'd rows match ORM/UPDATE writes
+    encode = engine.dialect._json_serializer or (lambda obj: json.dumps(obj, default=str))
+    buf = io.StringIO()
+    writer = csv.writer(buf)   # None → unquoted empty field → NULL in COPY's CSV format
+    for r in rows:
+        writer.writerow([encode(r[c]) if c == 'data' else r[c] for c in COPY_COLUMNS])
+    buf.seek(0)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {CompanyRecord.__tablename__} ({', '.join(COPY_COLUMNS)}) "
+                           "FROM STDIN WITH (FORMAT csv)", buf)
+    finally:
+        cursor.close()
+
 # ── Company definitions ────────────────────────────────────────
 # outsource_need: likelihood a company NEEDS to buy tech help vs. building it themselves
 # 1.0 = no internal tech team, clear business problem → perfect customer
@@ -190,11 +242,16 @@ COMPANIES = [
 
 db = SessionLocal()
 
+# One lookup for every slug; rows are then written in two bulk statements below
+existing_ids = set(db.scalars(select(CompanyRecord.id).where(CompanyRecord.id.in_([c['slug'] for c in COMPANIES]))))
+new_rows, update_rows = [], []
+now = utcnow()   # one timestamp for the whole seed run
+
 for cfg in COMPANIES:
     name    = cfg['name']
     slug    = cfg['slug']
     is_comp = cfg['competitor']
-    print(f"\nSeeding: {name} (competitor={is_comp})")
+    log(f"\nSeeding: {name} (competitor={is_comp})")
 
     # ── Get signals from cache ──────────────────────────────
     entry   = CACHE.get(name, {})
@@ -209,30 +266,32 @@ for cfg in COMPANIES:
     enriched = []
     for cat, items in raw_sigs.items():
         for item in items:
+            text = item.get('text', '')
             enriched.append({
-                'type':                classify(item.get('text', '')),
-                'text':                item.get('text', ''),
+                'type':                classify(text),
+                'text':                text,
                 'recency_days':        item.get('recency_days', 90),
                 'source':              item.get('source', cat),
                 'verified':            item.get('verified', False),
                 'verification_source': item.get('verification_source', ''),
             })
 
+    # One pass: per-type counts (first-seen order) and the verified count
+    type_counts, verified_count = Counter(), 0
+    for s in enriched:
+        type_counts[s['type']] += 1
+        if s['verified']:
+            verified_count += 1
+    key_signals = list(type_counts)[:3]   # first three signal types seen
+
     # ── Scores ─────────────────────────────────────────────
-    # Expansion: 3 strong signals = full marks
-    expansion  = min(1.0, len([s for s in enriched if s['type'] in {'HIRING','FUNDING','PRODUCT','GTM'}]) / 3.0)
-    strain     = round(expansion * 0.75 + len([s for s in enriched if s['type'] == 'INFRA']) * 0.1, 3)
+    # Expansion: 3 strong signals (HIRING/FUNDING/PRODUCT/GTM — anything but INFRA) = full marks
+    expansion  = min(1.0, (len(enriched) - type_counts['INFRA']) / 3.0)
+    strain     = round(expansion * 0.75 + type_counts['INFRA'] * 0.1, 3)
     risk       = 0.90 if is_comp else 0.05
     pain_score = round(0.5 * expansion + 0.3 * strain + 0.2 * (1 - risk), 3)
     pain_level = 'HIGH' if pain_score > 0.70 else 'MEDIUM' if pain_score > 0.40 else 'LOW'
 
-    best = {}
-    for s in enriched:
-        t = s['type']
-        if t not in best or (s.get('recency_days') or 999) < (best[t].get('recency_days') or 999):
-            best[t] = s
-    key_signals = list(best.keys())[:3]
-
     # LOW internal_tech_strength = they can't build it → they BUY it from us
     capability_gap = round(1.0 - cfg['internal_tech_strength'], 3)
     # Intent floor of 0.35 — even with 0 scraped signals, company params still drive intent
@@ -250,9 +309,10 @@ for cfg in COMPANIES:
     priority = priority_from(int(opp_sc * 100))
     score_int = int(opp_sc * 100) if not is_comp else 12
 
-    strategy, offer, entry_pt, persona_def, channel = strategy_from(intent, conv)
     if is_comp:
         strategy, offer, entry_pt, persona_def, channel = 'AVOID', 'Do not target', 'N/A', 'N/A', 'none'
+    else:
+        strategy, offer, entry_pt, persona_def, channel = strategy_from(intent, conv)
 
     dm_name = dm.get('name', '')
     # Use LLM persona role if available, else fall back to strategy template
@@ -266,13 +326,8 @@ for cfg in COMPANIES:
         message  = llm_outreach['email']
         subject  = llm_outreach.get('subject', f"{name} — quick idea on {entry_pt}")
     else:
-        sig_map = {
-            'HIRING':'rapid hiring and team expansion','FUNDING':'recent funding and capital deployment',
-            'INFRA':'increasing infrastructure complexity','PRODUCT':'new product/platform launches',
-            'GTM':'enterprise partnerships and go-to-market expansion'
-        }
-        signal_line = ' and '.join([sig_map.get(s,s) for s in key_signals[:2]]) or 'recent growth'
-        angle = {'BUILD_HEAVY':'accelerate delivery and reduce infra burden','CO_BUILD':'augment your internal team to ship faster','MONITOR':'share insights and stay aligned'}.get(strategy,'explore collaboration')
+        signal_line = ' and '.join([SIGNAL_PHRASES.get(s,s) for s in key_signals[:2]]) or 'recent growth'
+        angle = STRATEGY_ANGLES.get(strategy,'explore collaboration')
         subject = f"{name} — quick idea on {entry_pt}"
         message = f"""Hi {dm_name or dm_role},
 
@@ -284,13 +339,12 @@ Would it be useful to start with a quick 20-min call?
 
 – Datavex""".strip()
 
-    receptivity_map = {'HIGH':'HIGH — ACT WITHIN 90 DAYS','MEDIUM':'MODERATE — ACT WITHIN 6 MONTHS','LOW':'LOW — MONITOR'}
-    receptivity = 'COMPETITOR — DO NOT TARGET' if is_comp else receptivity_map.get(priority,'LOW — MONITOR')
+    receptivity = 'COMPETITOR — DO NOT TARGET' if is_comp else RECEPTIVITY.get(priority,'LOW — MONITOR')
     descriptor  = f"{cfg['industry']} · {cfg['employees']:,} employees · {cfg['size']} · {cfg['region']}"
 
     trace = [
         {'time':'00:01','agent':'TARGET_DISCOVERY','action':f"Found {name} — {cfg['industry']}, {cfg['size']}, {cfg['region']}"},
-        {'time':'00:05','agent':'SIGNAL_EXTRACTION','action':f"Pain: {pain_level}, {len(enriched)} signals, {sum(1 for s in enriched if s['verified'])} verified"},
+        {'time':'00:05','agent':'SIGNAL_EXTRACTION','action':f"Pain: {pain_level}, {len(enriched)} signals, {verified_count} verified"},
         {'time':'00:10','agent':'OPPORTUNITY_SCORING','action':f"Score: {score_int}/100, Priority: {priority}, Intent: {intent:.2f}"},
         {'time':'00:14','agent':'STRATEGY','action':f"Style: {strategy} — {offer}"},
         {'time':'00:18','agent':'DECISION_MAKER','action':f"Target: {dm_name} ({dm_role}) — entry: {entry_pt}"},
@@ -302,7 +356,7 @@ Would it be useful to start with a quick 20-min call?
         'pain_level': pain_level, 'pain_tags': key_signals,
         'competitor': is_comp,
         'competitor_note': meta.get('competitor_note', f"⚠️ Potential Competitor — Not a Target Client. {name} operates in the same space as Datavex." if is_comp else ''),
-        'signal_counts': {'verified': sum(1 for s in enriched if s.get('verified')), 'unverified': sum(1 for s in enriched if not s.get('verified')), 'total': len(enriched)},
+        'signal_counts': {'verified': verified_count, 'unverified': len(enriched) - verified_count, 'total': len(enriched)},
         'agent1': {'company_name':name,'domain':cfg['domain'],'industry':cfg['industry'],'size':cfg['size'],'estimated_employees':cfg['employees'],'region':cfg['region']},
         'agent2': {'fit_type':'COMPETITOR' if is_comp else 'TARGET','company_state':'MATURE' if is_comp else 'SCALE_UP','expansion_score':expansion,'strain_score':min(1.0,strain),'risk_score':risk,'pain_score':pain_score,'pain_level':pain_level,'signals':enriched},
         'agent3': {
@@ -355,21 +409,28 @@ Would it be useful to start with a quick 20-min call?
             a6_results = agent6_recommender.run(a4_decision, a2_sig)
             if a6_results:
                 new_data['agent6'] = a6_results[0]
-                print(f"  Agent6: {a6_results[0].get('lead_service','?')} ({a6_results[0].get('confidence','?')})")
+                log(f"  Agent6: {a6_results[0].get('lead_service','?')} ({a6_results[0].get('confidence','?')})")
         except Exception as e:
             print(f"  Agent6 failed: {e}")
 
-    existing = db.query(CompanyRecord).filter(CompanyRecord.id == slug).first()
-    if existing:
-        existing.score=score_int; existing.confidence=priority; existing.coverage=int(expansion*100)
-        existing.descriptor=descriptor; existing.data=new_data; existing.updated_at=utcnow()
-        flag_modified(existing, 'data')
-        print(f"  Updated: score={score_int}, priority={priority}")
+    row = dict(id=slug,score=score_int,confidence=priority,coverage=int(expansion*100),descriptor=descriptor,data=new_data,updated_at=now)
+    if slug in existing_ids:
+        update_rows.append(row)
+        log(f"  Updated: score={score_int}, priority={priority}")
     else:
-        db.add(CompanyRecord(id=slug,scan_id=None,name=name,descriptor=descriptor,score=score_int,confidence=priority,coverage=int(expansion*100),data=new_data,created_at=utcnow(),updated_at=utcnow()))
-        print(f"  Created: score={score_int}, priority={priority}")
+        new_rows.append(dict(row,scan_id=None,name=name,created_at=now))
+        log(f"  Created: score={score_int}, priority={priority}")
 
+# New rows: COPY on Postgres, else executemany INSERT (batched by SQLAlchemy's insertmanyvalues).
+# Existing rows: ORM bulk UPDATE by primary key.
+if new_rows:
+    if engine.dialect.name == 'postgresql':
+        bulk_copy(db, new_rows)
+    else:
+        db.execute(insert(CompanyRecord), new_rows)
+if update_rows:
+    db.execute(update(CompanyRecord), update_rows)
 db.commit()
 db.close()
-print("\n✅ Seed complete — all companies loaded.")
+print(f"\n✅ Seed complete — {len(new_rows)} created, {len(update_rows)} updated.")
 print("   Run: cd backend && uvicorn app.main:app --reload --port 8000")
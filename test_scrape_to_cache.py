@@ -0,0 +1,68 @@
+"""
+DataVex — Scraper-to-Cache Phase Cache Tests
+Checks that the tech phase only persists successful homepage scans (no network needed).
+"""
+import os
+import tempfile
+
+from scrape_to_cache import scan_homepage, scrape_cache
+import scrapers.tech_stack as tech_stack
+
+
+class _FakeResponse:
+    text = '<html><script src="/_next/static/app.js"></script></html>'
+    headers = {"Server": "nginx"}
+
+
+def _with_cache_dir(fn):
+    saved = scrape_cache.CACHE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        scrape_cache.CACHE_DIR = tmp
+        scrape_cache.set_enabled(True)
+        try:
+            fn(tmp)
+        finally:
+            scrape_cache.CACHE_DIR = saved
+
+
+def test_failed_scan_not_persisted():
+    def run(tmp):
+        def fail(*args, **kwargs):
+            raise ConnectionError("homepage unreachable")
+        saved, tech_stack.safe_get = tech_stack.safe_get, fail
+        try:
+            assert scan_homepage("example.invalid", "Example") is None
+        finally:
+            tech_stack.safe_get = saved
+        assert os.listdir(tmp) == [], os.listdir(tmp)
+    _with_cache_dir(run)
+    print("  ✓ Failed homepage fetch isn't written to the cache")
+
+
+def test_successful_scan_persisted():
+    def run(tmp):
+        saved, tech_stack.safe_get = tech_stack.safe_get, lambda *a, **kw: _FakeResponse()
+        try:
+            scan = scan_homepage("example.com", "Example")
+        finally:
+            tech_stack.safe_get = saved
+        assert "Next.js" in scan["frameworks"], scan
+        assert len(os.listdir(tmp)) == 1, os.listdir(tmp)
+        # Served from disk now — no fetch needed
+        assert scan_homepage("example.com", "Example") == scan
+    _with_cache_dir(run)
+    print("  ✓ Successful scan is cached and reused")
+
+
+def main():
+    print("\n  DataVex — Scraper-to-Cache Phase Cache Tests")
+    print("  " + "─" * 45)
+
+    test_failed_scan_not_persisted()
+    test_successful_scan_persisted()
+
+    print("\n  All 2 phase cache tests passed ✓\n")
+
+
+if __name__ == "__main__":
+    main()